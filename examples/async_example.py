@@ -1,216 +1,308 @@
 """Asynchronous usage examples for SerpShot SDK."""
 
 import asyncio
+import logging
+import os
+import sys
+from collections import defaultdict
+from typing import Any, cast
 
-from serpshot import AsyncSerpShot, SerpShotError
+from serpshot import AsyncSerpShot, SerpShotError, throttled_map
 from serpshot.models import SearchResponse
 
 # Replace with your actual API key
 API_KEY = "your-api-key-here"
 
+# Example output goes through logging; set SERPSHOT_LOG=WARNING to silence it
+# (e.g. when timing the examples)
+log = logging.getLogger("serpshot.examples")
 
-async def basic_search_example():
+
+async def basic_search_example(client):
     """Basic async search example."""
-    print("=== Basic Async Search Example ===\n")
+    log.info("=== Basic Async Search Example ===\n")
     
-    async with AsyncSerpShot(api_key=API_KEY) as client:
-        # Perform a simple search
-        response = await client.search("Python async programming")
-        
-        print(f"Query: {response.query}")
-        print(f"Total results: {response.total_results}")
-        print(f"Credits used: {response.credits_used}")
-        print(f"\nResults ({len(response.results)}):\n")
-        
-        for i, result in enumerate(response.results[:5], 1):
-            print(f"{i}. {result.title}")
-            print(f"   {result.link}\n")
+    # Perform a simple search
+    response = await client.search("Python async programming")
+    
+    log.info("Query: %s", response.query)
+    log.info("Total results: %s", response.total_results)
+    log.info("Credits used: %s", response.credits_used)
+    log.info("\nResults (%s):\n", len(response.results))
+    
+    for i, result in enumerate(response.results[:5], 1):
+        log.info("%s. %s", i, result.title)
+        log.info("   %s\n", result.link)
 
 
-async def get_credits_example():
+async def get_credits_example(client):
     """Get available credits example."""
-    print("=== Get Available Credits Example ===\n")
+    log.info("=== Get Available Credits Example ===\n")
     
-    async with AsyncSerpShot(api_key=API_KEY) as client:
-        credits = await client.get_available_credits()
-        print(f"Available credits: {credits}")
+    credits = await client.get_available_credits()
+    log.info("Available credits: %s", credits)
 
 
-async def batch_search_example():
+async def batch_search_example(client):
     """Batch search example using search with list.
     
     This is the recommended approach when you have multiple queries
     with the same parameters. It's more efficient than using asyncio.gather
     because it makes a single API call instead of multiple separate calls.
     """
-    print("=== Batch Search Example (Recommended) ===\n")
-    
-    async with AsyncSerpShot(api_key=API_KEY) as client:
-        # Perform batch search (single API call for all queries)
-        # This is more efficient than using asyncio.gather for same parameters
-        queries = [
-            "Python programming",
-            "JavaScript tutorials",
-            "Rust language",
-            "Go programming",
-        ]
-        
-        # Pass list to search() - single API call, returns list of responses
-        responses = await client.search(queries, num=5)
-
-        # Process results
-        # Type check: responses is list[SearchResponse] when query is list[str]
-        if isinstance(responses, list):
-            for query, response in zip(queries, responses):
-                print(f"{query}: {len(response.results)} results")
-                if response.results:
-                    print(f"  Top result: {response.results[0].title}\n")
-
-async def location_search_example():
+    log.info("=== Batch Search Example (Recommended) ===\n")
+    
+    # Perform batch search (single API call for all queries)
+    # This is more efficient than using asyncio.gather for same parameters
+    queries = [
+        "Python programming",
+        "JavaScript tutorials",
+        "Rust language",
+        "Go programming",
+    ]
+    
+    # search_batch() - single API call, always returns list[SearchResponse]
+    responses = await client.search_batch(queries, num=5)
+
+    # Process results - pull the result counts out once and reuse them
+    lengths = [len(response.results) for response in responses]
+    for query, response, count in zip(queries, responses, lengths):
+        log.info("%s: %s results", query, count)
+        if count:
+            log.info("  Top result: %s\n", response.results[0].title)
+    log.info("Total: %s results", sum(lengths))
+
+async def location_search_example(client):
     """Search with location parameter example - using string (recommended)."""
-    print("=== Location Search Example ===\n")
-    
-    async with AsyncSerpShot(api_key=API_KEY) as client:
-        # Search with location parameter for local results
-        # Using string format (recommended and simpler)
-        response = await client.search(
-            "best restaurants",
-            num=10,
-            gl="us",
-            location="US",  # String format: 'US', 'GB', 'CN', etc.
-        )
-        
-        print(f"Found {len(response.results)} results for '{response.query}'")
-        print(f"Total results: {response.total_results}")
-        print(f"Search time: {response.search_time}s")
-        if response.results:
-            print(f"Top result: {response.results[0].title}")
-            print(f"Top result URL: {response.results[0].link}\n")
-        else:
-            print("No results found.\n")
+    log.info("=== Location Search Example ===\n")
+    
+    # Search with location parameter for local results
+    # Using string format (recommended and simpler)
+    response = await client.search(
+        "best restaurants",
+        num=10,
+        gl="us",
+        location="US",  # String format: 'US', 'GB', 'CN', etc.
+    )
+    
+    log.info("Found %s results for '%s'", len(response.results), response.query)
+    log.info("Total results: %s", response.total_results)
+    log.info("Search time: %ss", response.search_time)
+    if response.results:
+        log.info("Top result: %s", response.results[0].title)
+        log.info("Top result URL: %s\n", response.results[0].link)
+    else:
+        log.info("No results found.\n")
+
 
+async def run_all(*coros):
+    """Await coroutines concurrently, cancelling the rest if one fails.
 
-async def concurrent_searches_example():
+    Unlike a bare ``asyncio.gather``, sibling requests do not keep running
+    (and spending credits) after the first error.
+    """
+    if sys.version_info >= (3, 11):
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(coro) for coro in coros]
+        except BaseExceptionGroup as group:  # noqa: F821 (builtin since 3.11)
+            # Re-raise a lone failure as itself, matching gather() on 3.10
+            if len(group.exceptions) == 1:
+                raise group.exceptions[0] from None
+            raise
+        return [task.result() for task in tasks]
+
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def grouped_batch_search(
+    client: AsyncSerpShot,
+    specs: list[tuple[str, dict[str, Any]]],
+    max_concurrency: int = 4,
+) -> list[SearchResponse]:
+    """Run searches with mixed parameters using as few API calls as possible.
+
+    Queries sharing the same parameters are grouped into a single batch call,
+    and only the groups run concurrently (bounded by a semaphore). Responses
+    are returned in the same order as ``specs``.
+    """
+    groups: defaultdict[frozenset[tuple[str, Any]], list[int]] = defaultdict(list)
+    for index, (_, params) in enumerate(specs):
+        groups[frozenset(params.items())].append(index)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    ordered: list[SearchResponse | None] = [None] * len(specs)
+
+    async def run_group(key: frozenset[tuple[str, Any]], indices: list[int]) -> None:
+        queries = [specs[i][0] for i in indices]
+        async with semaphore:
+            responses = await client.search_batch(queries, **dict(key))
+        for i, response in zip(indices, responses):
+            ordered[i] = response
+
+    await run_all(*(run_group(key, indices) for key, indices in groups.items()))
+    # Every slot has been filled once all groups have finished
+    return cast(list[SearchResponse], ordered)
+
+
+async def concurrent_searches_example(client):
     """Concurrent searches example with different parameters."""
-    print("=== Concurrent Searches Example (Different Parameters) ===\n")
-    
-    async with AsyncSerpShot(api_key=API_KEY) as client:
-        # When queries need different parameters, use asyncio.gather
-        # For same parameters, prefer batch_search_example() instead
-        tasks = [
-            client.search("Python programming", num=10, gl="us", location="US"),
-            client.search("JavaScript tutorials", num=5, gl="uk", location="GB"),
-            client.search("Rust language", num=20, gl="us", location="US"),
-        ]
-        
-        # Wait for all to complete
-        responses = await asyncio.gather(*tasks)
-        
-        # Process results
-        queries = ["Python programming", "JavaScript tutorials", "Rust language"]
-        for query, response in zip(queries, responses):
-            if isinstance(response, SearchResponse):
-                print(f"{query}: {len(response.results)} results")
-                if response.results:
-                    print(f"  Top result: {response.results[0].title}\n")
+    log.info("=== Concurrent Searches Example (Different Parameters) ===\n")
+    
+    # Queries that share parameters are sent as one batch call; only the
+    # distinct parameter groups run concurrently
+    specs = [
+        ("Python programming", {"num": 10, "gl": "us", "location": "US"}),
+        ("JavaScript tutorials", {"num": 5, "gl": "uk", "location": "GB"}),
+        ("Rust language", {"num": 10, "gl": "us", "location": "US"}),
+    ]
+    responses = await grouped_batch_search(client, specs)
+    
+    # Process results
+    for (query, _), response in zip(specs, responses):
+        log.info("%s: %s results", query, len(response.results))
+        if response.results:
+            log.info("  Top result: %s\n", response.results[0].title)
+
+
+async def throttled_searches_example(client):
+    """Many searches with rate and concurrency limits."""
+    log.info("=== Throttled Searches Example ===\n")
+    
+    # throttled_map replaces hand-rolled semaphores: at most 2 requests
+    # start per second and at most 2 are in flight at any time
+    queries = ["Python", "JavaScript", "Rust", "Go", "Kotlin"]
+    responses = await throttled_map(
+        client.search,
+        queries,
+        max_per_second=2,
+        max_at_once=2,
+        num=5,
+    )
+    
+    log.info("%s", "\n".join(
+        f"{query}: {len(response.results)} results"
+        for query, response in zip(queries, responses)
+    ))
 
 
-async def concurrent_image_searches_example():
+async def concurrent_image_searches_example(client):
     """Batch image searches example with location parameter."""
-    print("=== Batch Image Searches Example ===\n")
+    log.info("=== Batch Image Searches Example ===\n")
     
-    async with AsyncSerpShot(api_key=API_KEY) as client:
-        # Use batch search for multiple queries with same parameters
-        queries = ["cute cats", "beautiful landscapes", "modern architecture"]
-        
-        # Pass list to image_search() - single API call for all queries
-        # Include location parameter for local results
-        responses = await client.image_search(
-            queries, 
-            num=5,
-            gl="us",
-            location="US",
-        )
-        
-        # Process results
-        if isinstance(responses, list):
-            for query, response in zip(queries, responses):
-                print(f"{query}: {len(response.results)} images found")
+    # Use batch search for multiple queries with same parameters
+    queries = ["cute cats", "beautiful landscapes", "modern architecture"]
+    
+    # image_search_batch() - single API call for all queries
+    # Include location parameter for local results
+    responses = await client.image_search_batch(
+        queries, 
+        num=5,
+        gl="us",
+        location="US",
+    )
+    
+    # Process results - build the summary once and write it in a single call
+    log.info("%s", "\n".join(
+        f"{query}: {len(response.results)} images found"
+        for query, response in zip(queries, responses)
+    ))
 
 
-async def mixed_search_types_example():
+async def mixed_search_types_example(client):
     """Mix different search types concurrently."""
-    print("=== Mixed Search Types Example ===\n")
+    log.info("=== Mixed Search Types Example ===\n")
     
-    async with AsyncSerpShot(api_key=API_KEY) as client:
-        # Run different types of searches concurrently
-        normal_search = client.search("Python", num=10)
-        image_search = client.image_search("Python logo", num=5)
-        
-        # Wait for all
-        normal_resp, image_resp = await asyncio.gather(
-            normal_search,
-            image_search,
-        )
-        
-        print(f"Normal search: {len(normal_resp.results)} results")
-        print(f"Image search: {len(image_resp.results)} images")
+    # Open the connection first so both searches below start on a warm
+    # (HTTP/2 multiplexed) connection instead of racing to open their own
+    await client.warm_up()
+
+    # Run different types of searches concurrently
+    normal_search = client.search("Python", num=10)
+    image_search = client.image_search("Python logo", num=5)
+    
+    # Wait for all
+    normal_resp, image_resp = await run_all(
+        normal_search,
+        image_search,
+    )
+    
+    log.info("Normal search: %s results", len(normal_resp.results))
+    log.info("Image search: %s images", len(image_resp.results))
 
 
 async def error_handling_example():
     """Error handling in async context."""
-    print("=== Async Error Handling Example ===\n")
+    log.info("=== Async Error Handling Example ===\n")
     
     try:
         async with AsyncSerpShot(api_key=API_KEY) as client:
             response = await client.search("test query")
-            print(f"Success! Got {len(response.results)} results")
+            log.info("Success! Got %s results", len(response.results))
             
     except SerpShotError as api_error:
-        print(f"API Error: {api_error.message}")
-        if hasattr(api_error, 'status_code') and api_error.status_code:
-            print(f"Status code: {api_error.status_code}")
+        log.warning("API Error: %s", api_error.message)
+        if api_error.status_code:
+            log.warning("Status code: %s", api_error.status_code)
     except Exception as unexpected_error:
-        print(f"Unexpected error: {unexpected_error}")
+        log.error("Unexpected error: %s", unexpected_error)
 
 
+async def _guarded(example, client, semaphore: asyncio.Semaphore) -> None:
+    """Run a single example while holding a slot of the semaphore."""
+    async with semaphore:
+        await example(client)
 
 
 async def main():
-    """Run all async examples."""
-    try:
-        await get_credits_example()
-        print("\n" + "="*50 + "\n")
-
-        await basic_search_example()
-        print("\n" + "="*50 + "\n")
-
-        await location_search_example()
-        print("\n" + "="*50 + "\n")
-
-        await batch_search_example()
-        print("\n" + "="*50 + "\n")
+    """Run all async examples.
 
-        # Note: concurrent_searches_example shows when to use asyncio.gather
-        # (when queries need different parameters)
-        await concurrent_searches_example()
-        print("\n" + "="*50 + "\n")
-
-        await concurrent_image_searches_example()
-        print("\n" + "="*50 + "\n")
+    All examples share one client, so its connection pool (and the TLS
+    sessions in it) is reused instead of being rebuilt for every example.
+    The examples are independent, so they run concurrently (at most four at
+    a time) and their output may interleave.
+    """
+    examples = [
+        get_credits_example,
+        basic_search_example,
+        location_search_example,
+        batch_search_example,
+        # Note: concurrent_searches_example shows how to group queries
+        # with different parameters into as few batch calls as possible
+        concurrent_searches_example,
+        throttled_searches_example,
+        concurrent_image_searches_example,
+        mixed_search_types_example,
+    ]
+    semaphore = asyncio.Semaphore(4)
 
-        await mixed_search_types_example()
-        print("\n" + "="*50 + "\n")
+    try:
+        async with AsyncSerpShot(api_key=API_KEY) as client:
+            await run_all(*(_guarded(example, client, semaphore) for example in examples))
+        log.info("\n%s\n", "=" * 50)
 
         await error_handling_example()
         
     except Exception as main_error:
-        import traceback
-        print(f"Error running examples: {main_error}")
-        print(f"Error type: {type(main_error).__name__}")
-        traceback.print_exc()
-        print("\nMake sure to set your API_KEY at the top of this file!")
+        log.exception("Error running examples: %s", main_error)
+        log.error("Error type: %s", type(main_error).__name__)
+        log.error("\nMake sure to set your API_KEY at the top of this file!")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    logging.basicConfig(level=os.getenv("SERPSHOT_LOG", "INFO").upper(), format="%(message)s")
+
+    # Use uvloop's faster event loop when available (pip install serpshot[uvloop]).
+    # uvloop.run() replaces the deprecated uvloop.install() + asyncio.run().
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
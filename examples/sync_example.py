@@ -1,36 +1,42 @@
 """Synchronous usage examples for SerpShot SDK."""
 
+import logging
+import os
+
 from serpshot import SerpShot, SerpShotError
-from serpshot.models import SearchResponse
 
 # Replace with your actual API key
 API_KEY = "your-api-key-here"
 
+# Example output goes through logging; set SERPSHOT_LOG=WARNING to silence it
+# (e.g. when timing the examples)
+log = logging.getLogger("serpshot.examples")
+
 
 def basic_search_example():
     """Basic search example."""
-    print("=== Basic Search Example ===\n")
+    log.info("=== Basic Search Example ===\n")
     
     with SerpShot(api_key=API_KEY) as client:
         # Perform a simple search
         response = client.search("Python programming tutorials")
         
-        print(f"Query: {response.query}")
-        print(f"Total results: {response.total_results}")
-        print(f"Credits used: {response.credits_used}")
-        print(f"\nResults ({len(response.results)}):\n")
+        log.info("Query: %s", response.query)
+        log.info("Total results: %s", response.total_results)
+        log.info("Credits used: %s", response.credits_used)
+        log.info("\nResults (%s):\n", len(response.results))
         
         for i, result in enumerate(response.results, 1):
-            print(f"{i}. {result.title}")
-            print(f"   {result.link}")
+            log.info("%s. %s", i, result.title)
+            log.info("   %s", result.link)
             if result.snippet:
-                print(f"   {result.snippet[:100]}...")
-            print()
+                log.info("   %s...", result.snippet[:100])
+            log.info("")
 
 
 def advanced_search_example():
     """Advanced search with parameters."""
-    print("=== Advanced Search Example ===\n")
+    log.info("=== Advanced Search Example ===\n")
     
     with SerpShot(api_key=API_KEY) as client:
         # Search with additional parameters
@@ -44,14 +50,14 @@ def advanced_search_example():
             location="US",  # String format (recommended): 'US', 'GB', 'CN', etc.
         )
         
-        print(f"Found {len(response.results)} results for '{response.query}'")
-        print(f"Search time: {response.search_time}s")
-        print(f"Total results: {response.total_results}")
+        log.info("Found %s results for '%s'", len(response.results), response.query)
+        log.info("Search time: %ss", response.search_time)
+        log.info("Total results: %s", response.total_results)
 
 
 def image_search_example():
     """Image search example with location parameter."""
-    print("=== Image Search Example ===\n")
+    log.info("=== Image Search Example ===\n")
     
     with SerpShot(api_key=API_KEY) as client:
         # Image search with simple string location parameter
@@ -62,39 +68,39 @@ def image_search_example():
             location="US",  # Simple string format
         )
         
-        print(f"Found {len(response.results)} images\n")
+        log.info("Found %s images\n", len(response.results))
         
         for i, img in enumerate(response.results[:5], 1):
-            print(f"{i}. {img.title}")
-            print(f"   Image URL: {img.link}")
-            print(f"   Thumbnail: {img.thumbnail}")
-            print(f"   Size: {img.width}x{img.height}")
-            print()
+            log.info("%s. %s", i, img.title)
+            log.info("   Image URL: %s", img.link)
+            log.info("   Thumbnail: %s", img.thumbnail)
+            log.info("   Size: %sx%s", img.width, img.height)
+            log.info("")
 
 
 def pagination_example():
     """Pagination example."""
-    print("=== Pagination Example ===\n")
+    log.info("=== Pagination Example ===\n")
     
     with SerpShot(api_key=API_KEY) as client:
         query = "artificial intelligence"
         
         # Get first page
         page1 = client.search(query, num=10, page=1)
-        print(f"Page 1: {len(page1.results)} results")
+        log.info("Page 1: %s results", len(page1.results))
         
         # Get second page
         page2 = client.search(query, num=10, page=2)
-        print(f"Page 2: {len(page2.results)} results")
+        log.info("Page 2: %s results", len(page2.results))
         
         # Get third page
         page3 = client.search(query, num=10, page=3)
-        print(f"Page 3: {len(page3.results)} results")
+        log.info("Page 3: %s results", len(page3.results))
 
 
 def error_handling_example():
     """Error handling example."""
-    print("=== Error Handling Example ===\n")
+    log.info("=== Error Handling Example ===\n")
     
     try:
         # Without context manager for explicit error handling
@@ -102,27 +108,27 @@ def error_handling_example():
         
         try:
             response = client.search("test query")
-            print(f"Success! Got {len(response.results)} results")
+            log.info("Success! Got %s results", len(response.results))
             
         except SerpShotError as api_error:
-            print(f"API Error: {api_error.message}")
-            if hasattr(api_error, 'status_code') and api_error.status_code:
-                print(f"Status code: {api_error.status_code}")
+            log.warning("API Error: %s", api_error.message)
+            if api_error.status_code:
+                log.warning("Status code: %s", api_error.status_code)
                 
         finally:
             client.close()
             
     except Exception as unexpected_error:
-        print(f"Unexpected error: {unexpected_error}")
+        log.error("Unexpected error: %s", unexpected_error)
 
 
 def get_credits_example():
     """Get available credits example."""
-    print("=== Get Available Credits Example ===\n")
+    log.info("=== Get Available Credits Example ===\n")
     
     with SerpShot(api_key=API_KEY) as client:
         credits = client.get_available_credits()
-        print(f"Available credits: {credits}")
+        log.info("Available credits: %s", credits)
 
 
 def batch_search_example():
@@ -132,45 +138,44 @@ def batch_search_example():
     with the same parameters. It makes a single API call instead of
     multiple separate calls, which is more efficient.
     """
-    print("=== Batch Search Example (Recommended) ===\n")
+    log.info("=== Batch Search Example (Recommended) ===\n")
     
     with SerpShot(api_key=API_KEY) as client:
         queries = ["Python", "JavaScript", "Rust"]
-        # Pass list to search() - single API call, returns list of responses
-        responses = client.search(queries, num=5)
+        # search_batch() - single API call, always returns list[SearchResponse]
+        responses = client.search_batch(queries, num=5)
         
-        # Type check: responses is list[SearchResponse] when query is list[str]
-        if isinstance(responses, list):
-            for query, response in zip(queries, responses):
-                if isinstance(response, SearchResponse):
-                    print(f"{query}: {len(response.results)} results")
-                    if response.results:
-                        print(f"  Top: {response.results[0].title}\n")
+        for query, response in zip(queries, responses):
+            log.info("%s: %s results", query, len(response.results))
+            if response.results:
+                log.info("  Top: %s\n", response.results[0].title)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("SERPSHOT_LOG", "INFO").upper(), format="%(message)s")
+
     # Run all examples
     try:
         get_credits_example()
-        print("\n" + "="*50 + "\n")
+        log.info("\n%s\n", "=" * 50)
         
         basic_search_example()
-        print("\n" + "="*50 + "\n")
+        log.info("\n%s\n", "=" * 50)
         
         advanced_search_example()
-        print("\n" + "="*50 + "\n")
+        log.info("\n%s\n", "=" * 50)
         
         image_search_example()
-        print("\n" + "="*50 + "\n")
+        log.info("\n%s\n", "=" * 50)
         
         pagination_example()
-        print("\n" + "="*50 + "\n")
+        log.info("\n%s\n", "=" * 50)
         
         batch_search_example()
-        print("\n" + "="*50 + "\n")
+        log.info("\n%s\n", "=" * 50)
         
         error_handling_example()
         
     except Exception as main_error:
-        print(f"Error running examples: {main_error}")
-        print("\nMake sure to set your API_KEY at the top of this file!")
+        log.error("Error running examples: %s", main_error)
+        log.error("\nMake sure to set your API_KEY at the top of this file!")
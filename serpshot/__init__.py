@@ -30,6 +30,8 @@ Example:
 __version__ = "0.1.3"
 
 from ._auth import AuthHandler
+from ._http import DEFAULT_LIMITS, CacheInfo
+from ._throttle import throttled_map
 from .async_client import AsyncSerpShot
 from .client import SerpShot
 from .exceptions import (
@@ -57,6 +59,11 @@ __all__ = [
     "AsyncSerpShot",
     # Authentication
     "AuthHandler",
+    # HTTP
+    "DEFAULT_LIMITS",
+    "CacheInfo",
+    # Helpers
+    "throttled_map",
     # Exceptions
     "SerpShotError",
     "AuthenticationError",
@@ -1,41 +1,68 @@
 """Authentication handler for SerpShot API."""
 
+import re
+import sys
+from types import MappingProxyType
+
 from .exceptions import AuthenticationError
 from .types import Headers
 
 __all__ = ["AuthHandler"]
 
+# API keys are sent verbatim in the X-API-Key header, so only reject what is
+# unsafe there: whitespace, control characters and non-ASCII. Everything else
+# (including base64 characters such as + / =) is left to the server to judge.
+_API_KEY_RE = re.compile(r"[\x21-\x7e]+")
+
+# Interned header names/values so header dict lookups hit the identity fast path
+_HDR_API_KEY = sys.intern("X-API-Key")
+_HDR_CONTENT_TYPE = sys.intern("Content-Type")
+_HDR_ACCEPT = sys.intern("Accept")
+_JSON_MIME = sys.intern("application/json")
+
 
 class AuthHandler:
     """Handles API authentication."""
 
+    __slots__ = ("api_key", "_headers", "_headers_ro")
+
     def __init__(self, api_key: str | None = None) -> None:
         """Initialize authentication handler.
 
         Args:
             api_key: SerpShot API key
+
+        Raises:
+            AuthenticationError: If API key is missing or malformed
         """
         if not api_key or not api_key.strip():
             raise AuthenticationError("API key is required")
-        self.api_key = api_key.strip()
+        self.api_key = sys.intern(api_key.strip())
+        self.validate()
+        # Headers never change for a given key, so build them once and hand out
+        # a read-only view instead of a fresh dict per request.
+        self._headers: dict[str, str] = {
+            _HDR_API_KEY: self.api_key,
+            _HDR_CONTENT_TYPE: _JSON_MIME,
+            _HDR_ACCEPT: _JSON_MIME,
+        }
+        self._headers_ro: Headers = MappingProxyType(self._headers)
 
     def get_headers(self) -> Headers:
         """Get authentication headers.
 
         Returns:
-            Dictionary of headers with API key
+            Read-only mapping of headers with API key. Merge with
+            ``{**auth.get_headers(), ...}`` when extra headers are needed.
         """
-        return {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        return self._headers_ro
 
     def validate(self) -> None:
         """Validate API key format.
 
         Raises:
-            AuthenticationError: If API key is invalid
+            AuthenticationError: If API key contains characters that are not
+                allowed in an HTTP header
         """
-        if not self.api_key or len(self.api_key) < 10:
-            raise AuthenticationError("API key appears to be invalid")
+        if not _API_KEY_RE.fullmatch(self.api_key):
+            raise AuthenticationError("API key format invalid")
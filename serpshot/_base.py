@@ -1,23 +1,122 @@
 """Base client with shared logic for sync and async clients."""
 
 import os
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import itemgetter
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from ._auth import AuthHandler
-from .models import SearchRequest, SearchResponse
+from ._json import json_dumps
+from .models import ImageResult, SearchRequest, SearchResponse, SearchResult
 from .types import LocationType, SearchType
 
-__all__ = ["BaseClient"]
+__all__ = ["BaseClient", "IMAGE_VALUE", "SEARCH_VALUE"]
 
 # Environment variable name for API key
 ENV_API_KEY = "SERPSHOT_API_KEY"
 
+# Plain-string search types for the request path: str hashes in C, while Enum
+# members hash through the Python-level Enum.__hash__ (about 100ns per lookup
+# of the cached request template)
+SEARCH_VALUE = SearchType.SEARCH.value
+IMAGE_VALUE = SearchType.IMAGE.value
+
+
+# Backend image fields (with defaults) and the client field each maps to
+_IMAGE_DEFAULTS: dict[str, Any] = {
+    "title": "",
+    "imageUrl": "",
+    "thumbnailUrl": "",
+    "source": "",
+    "link": "",
+    "imageWidth": 0,
+    "imageHeight": 0,
+    "position": 0,
+}
+_IMAGE_CLIENT_KEYS = (
+    "title",
+    "link",
+    "thumbnail",
+    "source",
+    "source_link",
+    "width",
+    "height",
+    "position",
+)
+_IMAGE_GETTER = itemgetter(*_IMAGE_DEFAULTS)
+
+
+# Prebuilt list validators: one call validates every result inside pydantic-core.
+# This is faster than skipping validation with model_construct(), which runs a
+# Python-level loop per item (about 4x slower for a 100-result page).
+_validate_image_results = TypeAdapter(list[ImageResult]).validate_python
+_validate_search_results = TypeAdapter(list[SearchResult]).validate_python
+
+
+# Fixed-shape dict copied for every parsed response (cheaper than a literal)
+_RESPONSE_TEMPLATE: dict[str, Any] = dict.fromkeys(SearchResponse.model_fields)
+_RESPONSE_TEMPLATE["success"] = True
+
+# Credit estimation: base cost per search type and regions that cost more
+_BASE_CREDITS = {SearchType.SEARCH: 1, SearchType.IMAGE: 2}
+_PREMIUM_REGIONS = frozenset({"us", "uk", "ca", "au"})
+
+# Template for responses without data; only the query differs per call
+_EMPTY_RESPONSE = SearchResponse(
+    success=True,
+    query="",
+    total_results="0",
+    search_time="0",
+    results=[],
+    credits_used=0,
+)
+
+
+@lru_cache(maxsize=256)
+def _build_request_prefix(
+    search_type: str,
+    num: int,
+    page: int,
+    gl: str,
+    hl: str,
+    lr: str,
+    location: str | LocationType | None,
+) -> bytes:
+    """Validate and encode all search parameters except the queries.
+
+    Results are memoized, so repeated searches with the same parameters skip
+    Pydantic validation and encoding entirely.
+
+    Returns:
+        JSON bytes like ``{"type":"search",...,"queries":`` so a request body
+        is this prefix, the encoded query list and a closing brace
+    """
+    request = SearchRequest(
+        queries=["_"],
+        type=SearchType(search_type),
+        num=num,
+        page=page,
+        gl=gl,
+        hl=hl,
+        lr=lr,
+        location=location,
+    )
+    params = request.model_dump(exclude_none=True, exclude={"queries"})
+    return json_dumps(params)[:-1] + b',"queries":'
+
 
 class BaseClient:
     """Base client containing shared logic."""
 
     DEFAULT_BASE_URL = "https://api.serpshot.com"
 
+    # Maximum number of queries the API accepts in a single search request.
+    # Longer query lists are split into chunks of this size.
+    MAX_BATCH_SIZE = 100
+
     @staticmethod
     def _get_api_key(api_key: str | None = None) -> str:
         """Get API key from parameter or environment variable.
@@ -61,37 +160,25 @@ class BaseClient:
         """
         resolved_api_key = self._get_api_key(api_key)
         self.auth = AuthHandler(resolved_api_key)
+        self._auth_headers = self.auth.get_headers()
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
 
 
     @staticmethod
-    def _transform_image_result(result: dict[str, Any]) -> dict[str, Any]:
-        """Transform backend image result fields to client schema.
-
-        Backend fields -> Client fields:
-        - imageUrl -> link (the actual image URL)
-        - link -> source_link (the source page URL)
-        - imageWidth -> width
-        - imageHeight -> height
+    def _empty_search_response(query: str) -> SearchResponse:
+        """Build a successful response with no results.
 
         Args:
-            result: Raw image result from backend
+            query: Query string to report
 
         Returns:
-            Transformed result matching ImageResult schema
+            SearchResponse with empty results
         """
-        return {
-            "title": result.get("title", ""),
-            "link": result.get("imageUrl", ""),
-            "thumbnail": result.get("thumbnailUrl", ""),
-            "source": result.get("source", ""),
-            "source_link": result.get("link", ""),
-            "width": result.get("imageWidth", 0),
-            "height": result.get("imageHeight", 0),
-            "position": result.get("position", 0),
-        }
+        # Copying the prebuilt template skips validation; results gets a fresh
+        # list so responses never share a mutable list
+        return _EMPTY_RESPONSE.model_copy(update={"query": query, "results": []})
 
     @staticmethod
     def _parse_search_response(
@@ -107,75 +194,65 @@ class BaseClient:
         Returns:
             Parsed SearchResponse model (with empty results if no data)
         """
-        # Handle empty or None data - return empty response instead of raising exception
-        if data is None:
-            return SearchResponse(
-                success=True,
-                query=query,
-                total_results="0",
-                search_time="0",
-                results=[],
-                credits_used=0,
-            )
-
         # If backend returns a list (for batch queries), take the first result
-        if isinstance(data, list):
-            if not data:
-                # Empty list is a valid response - return empty SearchResponse
-                return SearchResponse(
-                    success=True,
-                    query=query,
-                    total_results="0",
-                    search_time="0",
-                    results=[],
-                    credits_used=0,
-                )
+        if isinstance(data, list) and data:
             data = data[0]
 
-        # Backend response structure mapping
-        search_info = data.get("search_info", {}) if isinstance(data, dict) else {}
-        results = data.get("results", []) if isinstance(data, dict) else []
-        search_type = (
-            data.get("search_params", {}).get("type", "search")
-            if isinstance(data, dict)
-            else "search"
-        )
+        # Empty or unexpected data is a valid response - return an empty
+        # SearchResponse instead of raising
+        if not isinstance(data, dict):
+            return BaseClient._empty_search_response(query)
 
-        # Transform image results to match client schema
-        if search_type == "image":
-            results = [BaseClient._transform_image_result(r) for r in results]
-
-        response_data = {
-            "success": True,
-            "query": (
-                data.get("search_params", {}).get("q", query)
-                if isinstance(data, dict)
-                else query
-            ),
-            "total_results": search_info.get("total_results", "0"),
-            "search_time": search_info.get("search_time", "0"),
-            "results": results,
-            "credits_used": data.get("credits", 0) if isinstance(data, dict) else 0,
-        }
+        # Backend response structure mapping
+        search_params = data.get("search_params") or {}
+        search_info = data.get("search_info") or {}
+        results = data.get("results") or []
+
+        # Validate the whole list against its concrete model up front (image
+        # results are transformed to the client schema first), so SearchResponse
+        # does not have to try every member of its results union per item
+        if search_params.get("type", "search") == "image":
+            # Map backend image fields to the client schema:
+            # imageUrl -> link, link -> source_link, imageWidth/imageHeight -> width/height
+            keys, getter, defaults = _IMAGE_CLIENT_KEYS, _IMAGE_GETTER, _IMAGE_DEFAULTS
+            try:
+                # The backend normally sends every field, so skip merging in
+                # defaults unless an item turns out to be incomplete
+                mapped = [dict(zip(keys, getter(r))) for r in results]
+            except KeyError:
+                mapped = [dict(zip(keys, getter(defaults | r))) for r in results]
+            results = _validate_image_results(mapped)
+        else:
+            results = _validate_search_results(results)
+
+        response_data = _RESPONSE_TEMPLATE.copy()
+        response_data["query"] = search_params.get("q", query)
+        response_data["total_results"] = search_info.get("total_results", "0")
+        response_data["search_time"] = search_info.get("search_time", "0")
+        response_data["results"] = results
+        response_data["credits_used"] = data.get("credits", 0)
 
         return SearchResponse.model_validate(response_data)
 
     @staticmethod
-    def _build_search_request_params(
+    def _build_search_request_body(
         query: str | list[str],
-        search_type: SearchType,
+        search_type: str,
         num: int = 10,
         page: int = 1,
         gl: str = "us",
         hl: str = "en",
         lr: str = "en",
         location: str | LocationType | None = None,
-    ) -> dict[str, Any]:
-        """Build search request parameters - shared logic for search and image_search.
+    ) -> bytes:
+        """Build the JSON request body - shared logic for search and image_search.
+
+        Only the query list is encoded per call; the rest of the body is a
+        cached prefix per parameter combination.
 
         Args:
             query: Search query string or list of query strings
-            search_type: Type of search (SEARCH or IMAGE)
+            search_type: Search type value (SEARCH_VALUE or IMAGE_VALUE)
             num: Number of results to return per page (1-100, default: 10)
             page: Page number for pagination (starts from 1, default: 1)
             gl: Country code
@@ -184,31 +261,66 @@ class BaseClient:
             location: Location type for local search (e.g., 'US', 'GB', or LocationType.US)
 
         Returns:
-            Dictionary of request parameters
+            UTF-8 encoded JSON request body
         """
-        # Normalize to list
-        queries = [query] if isinstance(query, str) else query
+        queries = BaseClient._normalize_queries(query)
+        prefix = _build_request_prefix(search_type, num, page, gl, hl, lr, location)
+        return prefix + json_dumps(queries) + b"}"
 
-        # Build request with queries list
-        request = SearchRequest(
-            queries=queries,
-            type=search_type,
-            num=num,
-            page=page,
-            gl=gl,
-            hl=hl,
-            lr=lr,
-            location=location,
-        )
+    @staticmethod
+    def _normalize_queries(query: str | list[str]) -> list[str]:
+        """Normalize a query or query list and validate it for one request.
+
+        Args:
+            query: Search query string or list of query strings
 
-        params = request.model_dump(exclude_none=True)
-        # Convert enum values to strings
-        if "type" in params:
-            params["type"] = params["type"].value
-        if "location" in params and isinstance(params["location"], LocationType):
-            params["location"] = params["location"].value
+        Returns:
+            List of query strings
 
-        return params
+        Raises:
+            ValueError: If there are no queries, more than MAX_BATCH_SIZE
+                queries, or a query is not a string, is empty or is too long
+        """
+        queries = [query] if isinstance(query, str) else list(query)
+        if len(queries) > BaseClient.MAX_BATCH_SIZE:
+            raise ValueError(
+                f"At most {BaseClient.MAX_BATCH_SIZE} queries are allowed per request"
+            )
+        SearchRequest.validate_queries(queries)
+        return queries
+
+    @classmethod
+    def _chunk_queries(cls, queries: list[str], size: int | None = None) -> list[list[str]]:
+        """Split a query list into chunks the API accepts in one request.
+
+        Args:
+            queries: Query strings
+            size: Queries per chunk (defaults to MAX_BATCH_SIZE)
+
+        Returns:
+            Consecutive chunks of at most ``size`` queries
+        """
+        size = size or cls.MAX_BATCH_SIZE
+        return [queries[i : i + size] for i in range(0, len(queries), size)]
+
+    @classmethod
+    def _resolve_chunk_size(cls, chunk_size: int | None) -> int:
+        """Resolve how many queries to send per request.
+
+        Args:
+            chunk_size: Requested chunk size, or None for MAX_BATCH_SIZE
+
+        Returns:
+            Number of queries per request
+
+        Raises:
+            ValueError: If chunk_size is outside 1..MAX_BATCH_SIZE
+        """
+        if chunk_size is None:
+            return cls.MAX_BATCH_SIZE
+        if not 1 <= chunk_size <= cls.MAX_BATCH_SIZE:
+            raise ValueError(f"chunk_size must be between 1 and {cls.MAX_BATCH_SIZE}")
+        return chunk_size
 
     @staticmethod
     def _process_search_response(
@@ -228,41 +340,22 @@ class BaseClient:
         if not isinstance(data, list):
             data = [data]
 
-        # Handle empty data - return empty response(s) instead of raising exception
-        if not data:
-            if isinstance(query, str):
-                # Single query with no data - return empty SearchResponse
-                return BaseClient._parse_search_response(None, query=query)
-            else:
-                # Batch query with no data - return list of empty SearchResponses
-                return [
-                    BaseClient._parse_search_response(None, query=q) for q in query
-                ]
-
         # Normalize query to list for easier processing
         queries = [query] if isinstance(query, str) else query
 
-        # Parse each response item
+        # Pair each query with its result in one pass; queries without a result
+        # (short or empty data) get an empty response instead of an exception
+        parse = BaseClient._parse_search_response
         responses = [
-            BaseClient._parse_search_response(item, query=q)
-            for item, q in zip(data, queries[: len(data)])
+            parse(item, query=q) for item, q in zip(chain(data, repeat(None)), queries)
         ]
 
-        # If we have fewer responses than queries, fill with empty responses
-        if len(responses) < len(queries):
-            responses.extend(
-                [
-                    BaseClient._parse_search_response(None, query=q)
-                    for q in queries[len(responses) :]
-                ]
-            )
-
         # Return single response for single query, list for batch
         return responses[0] if isinstance(query, str) else responses
 
     @staticmethod
     def _calculate_credits(
-            search_type: SearchType,
+        search_type: SearchType,
         num: int,
         gl: str | None = None,
     ) -> int:
@@ -276,20 +369,11 @@ class BaseClient:
         Returns:
             Estimated credit cost
         """
-        # Base cost
-        base_cost = 1
-
-        # Image search typically costs more
-        if search_type == SearchType.IMAGE:
-            base_cost = 2
-
-        # Higher result counts may cost more
-        if num > 10:
-            base_cost += (num - 10) // 10
+        # Base cost by search type, plus one credit per 10 results beyond 10
+        cost = _BASE_CREDITS.get(search_type, 1) + max(0, num - 10) // 10
 
-        # Some regions may have different costs
-        premium_regions = {"us", "uk", "ca", "au"}
-        if gl and gl.lower() in premium_regions:
-            base_cost = int(base_cost * 1.2)
+        # Some regions cost 20% more (integer math, rounded down)
+        if gl and gl.lower() in _PREMIUM_REGIONS:
+            cost = cost * 6 // 5
 
-        return max(1, base_cost)
+        return max(1, cost)
@@ -0,0 +1,114 @@
+"""Micro-batching of concurrent single-query searches."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from typing import Any, Generic, TypeVar
+
+__all__ = ["QueryBatcher"]
+
+T = TypeVar("T")
+
+
+class QueryBatcher(Generic[T]):
+    """Coalesce queries submitted within a short window into batch requests.
+
+    Queries are grouped by an options key, since only queries with identical
+    search options can share one request. A group is sent once the window
+    elapses or it reaches ``max_batch`` queries, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[str], dict[str, Any]], Awaitable[list[T]]],
+        window: float = 0.005,
+        max_batch: int = 100,
+    ) -> None:
+        """Initialize batcher.
+
+        Args:
+            send: Async callable sending one batch; must return one result
+                per query, in order
+            window: Seconds to wait for more queries before sending
+            max_batch: Maximum number of queries per batch
+        """
+        self._send = send
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: dict[Hashable, list[tuple[str, asyncio.Future[T]]]] = {}
+        self._options: dict[Hashable, dict[str, Any]] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Future[None]] = set()
+
+    async def submit(self, query: str, key: Hashable, options: dict[str, Any]) -> T:
+        """Queue a query and wait for its result.
+
+        Args:
+            query: Search query
+            key: Hashable identity of ``options``
+            options: Search options shared by every query in the batch
+
+        Returns:
+            Result for this query
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[T] = loop.create_future()
+        group = self._pending.setdefault(key, [])
+        group.append((query, future))
+
+        if len(group) == 1:
+            self._options[key] = options
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+        if len(group) >= self.max_batch:
+            self._flush(key)
+
+        return await future
+
+    def _flush(self, key: Hashable) -> None:
+        """Start sending the pending group for a key."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        group = self._pending.pop(key, None)
+        options = self._options.pop(key, {})
+        if group:
+            # Keep a reference so the task is not garbage collected mid-flight
+            task = asyncio.ensure_future(self._run(group, options))
+            self._tasks.add(task)
+            task.add_done_callback(partial(self._run_done, group))
+
+    async def _run(
+        self,
+        group: list[tuple[str, asyncio.Future[T]]],
+        options: dict[str, Any],
+    ) -> None:
+        """Send one batch and resolve each caller's future."""
+        try:
+            results = await self._send([query for query, _ in group], options)
+        except Exception as e:
+            for _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(group, results):
+            if not future.done():
+                future.set_result(result)
+        for _, future in group[len(results) :]:
+            if not future.done():
+                future.set_exception(RuntimeError("Batch returned no result for this query"))
+
+    def _run_done(
+        self,
+        group: list[tuple[str, asyncio.Future[T]]],
+        task: asyncio.Future[None],
+    ) -> None:
+        """Release a finished batch task and cancel callers it left waiting.
+
+        Futures are still pending here only if the task was cancelled (possibly
+        before it started) or a BaseException escaped ``send``.
+        """
+        self._tasks.discard(task)
+        for _, future in group:
+            if not future.done():
+                future.cancel()
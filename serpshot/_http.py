@@ -1,18 +1,272 @@
 """HTTP client wrapper with retry logic."""
 
 import asyncio
+import copy
 import logging
-from typing import Any
+import math
+import random
+import threading
+import time
+from collections.abc import Hashable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Any, NamedTuple
+from urllib.request import getproxies
 
 import httpx
 
+from ._json import JSONDecodeError, json_loads
 from .exceptions import APIError, NetworkError, RateLimitError
 from .types import Headers
 
-__all__ = ["HTTPClient", "AsyncHTTPClient", "_parse_response"]
+__all__ = [
+    "HTTPClient",
+    "AsyncHTTPClient",
+    "CacheInfo",
+    "DEFAULT_LIMITS",
+    "HTTP2_AVAILABLE",
+    "_parse_response",
+]
 
 logger = logging.getLogger(__name__)
 
+# Connection pool defaults: keep warm connections around so consecutive
+# requests reuse TCP/TLS sessions instead of re-handshaking.
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
+# HTTP/2 needs the ``h2`` package, installed with ``httpx[http2]``
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Failed connection attempts are retried immediately inside the httpx
+# transport (nothing was sent yet, so this is always safe); everything else
+# goes through the retry loop with backoff below. Only applies when no proxy
+# is configured in the environment (see _environment_proxies_configured).
+CONNECT_RETRIES = 2
+
+# Backoff settings (seconds): first retry waits at least the base, no retry
+# waits longer than the cap unless the server asks for it
+RETRY_BACKOFF_BASE = 0.25
+RETRY_BACKOFF_CAP = 10.0
+
+
+def _parse_retry_after(headers: httpx.Headers) -> float | None:
+    """Extract how long to wait before retrying from response headers.
+
+    Supports ``Retry-After`` (seconds or HTTP date) and ``X-RateLimit-Reset``
+    (seconds to wait or a Unix timestamp).
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds to wait, or None if the headers carry no hint
+    """
+    now = datetime.now(timezone.utc).timestamp()
+
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            retry_at = None
+        if retry_at is not None:
+            return max(0.0, retry_at.timestamp() - now)
+
+    reset = headers.get("X-RateLimit-Reset")
+    if reset is not None:
+        try:
+            reset_value = float(reset)
+        except ValueError:
+            return None
+        # Large values are Unix timestamps, small ones are a delay in seconds
+        if reset_value > 1_000_000_000:
+            reset_value -= now
+        return max(0.0, reset_value)
+
+    return None
+
+
+def _backoff_delay(previous: float, retry_after: float | None = None) -> float:
+    """Compute how long to sleep before the next attempt.
+
+    Uses decorrelated jitter: each delay is drawn between the base and three
+    times the previous delay, then capped. Concurrent clients retrying the same
+    outage spread out instead of hitting the API in lockstep.
+
+    Args:
+        previous: Delay used before the previous attempt (the base on the first retry)
+        retry_after: Server-provided wait hint in seconds, if any
+
+    Returns:
+        Delay in seconds (never shorter than the server hint)
+    """
+    delay = min(RETRY_BACKOFF_CAP, random.uniform(RETRY_BACKOFF_BASE, previous * 3))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def _environment_proxies_configured() -> bool:
+    """Report whether HTTP(S)_PROXY/ALL_PROXY (any case) is set.
+
+    httpx only applies environment proxies (and NO_PROXY) when no custom
+    transport is passed, so clients fall back to httpx's default transport
+    when a proxy is configured.
+    """
+    return any(scheme != "no" for scheme in getproxies())
+
+
+def _request_key(method: str, path: str, kwargs: dict[str, Any]) -> Hashable | None:
+    """Build a key identifying an idempotent request, or None.
+
+    Only GET requests without a body get a key; they are the only ones that
+    may be cached or coalesced.
+    """
+    if method.upper() != "GET" or any(k in kwargs for k in ("json", "content", "data")):
+        return None
+    params = kwargs.get("params") or {}
+    try:
+        return (path, tuple(sorted(dict(params).items())))
+    except (TypeError, ValueError):
+        return None
+
+
+class _PendingCall:
+    """Result slot shared by threads waiting on the same in-flight request."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class CacheInfo(NamedTuple):
+    """Response cache statistics, in the style of ``functools.lru_cache``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+# Sentinel returned by _ResponseCache.get() on a miss (None is a valid payload)
+_MISSING: Any = object()
+
+
+class _CacheEntry(NamedTuple):
+    """Cached payload with its expiry time and HTTP validators."""
+
+    expires: float
+    value: Any
+    etag: str | None
+    last_modified: str | None
+
+
+class _ResponseCache:
+    """Thread-safe TTL cache of parsed GET responses.
+
+    Expired entries that carry an ``ETag`` or ``Last-Modified`` validator are
+    kept so the next request can revalidate them with a conditional request
+    instead of downloading the body again.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        """Initialize cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum number of entries (oldest are evicted first)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[Hashable, _CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return a copy of the cached payload, or _MISSING."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires <= time.monotonic():
+                if entry is not None and entry.etag is None and entry.last_modified is None:
+                    del self._entries[key]
+                self.misses += 1
+                return _MISSING
+            self.hits += 1
+            value = entry.value
+        # Hand out copies so callers cannot mutate the cached payload
+        return copy.deepcopy(value)
+
+    def conditional_headers(self, key: Hashable) -> dict[str, str]:
+        """Return If-None-Match / If-Modified-Since headers for a stale entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+        headers: dict[str, str] = {}
+        if entry is not None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidate(self, key: Hashable) -> Any:
+        """Refresh a stale entry after a 304 and return a copy, or _MISSING."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            self._entries[key] = entry._replace(expires=time.monotonic() + self.ttl)
+            value = entry.value
+        return copy.deepcopy(value)
+
+    def store(self, key: Hashable, response: httpx.Response, value: Any) -> None:
+        """Cache a parsed payload unless the response forbids it."""
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        entry = _CacheEntry(
+            time.monotonic() + self.ttl,
+            copy.deepcopy(value),
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
 
 def _parse_response(response: httpx.Response) -> Any:
     """Parse HTTP response and unwrap API wrapper.
@@ -25,28 +279,39 @@ def _parse_response(response: httpx.Response) -> Any:
 
     Raises:
         RateLimitError: When rate limit is exceeded
-        APIError: When API returns an error
+        APIError: When API returns an error or a body that is not valid JSON
     """
     # Handle rate limiting
     if response.status_code == 429:
-        retry_after = int(response.headers.get("Retry-After", 60))
+        wait_hint = _parse_retry_after(response.headers)
+        retry_after = math.ceil(wait_hint) if wait_hint is not None else 60
         raise RateLimitError(
             f"Rate limit exceeded. Retry after {retry_after} seconds",
             retry_after=retry_after,
         )
 
+    # Decode the body exactly once; error bodies that are not JSON are ignored
+    status_code = response.status_code
+    content = response.content
+    try:
+        json_data = json_loads(content) if content else None
+    except JSONDecodeError as e:
+        if status_code < 400:
+            raise APIError(
+                "Invalid JSON in API response",
+                status_code=status_code,
+            ) from e
+        json_data = None
+
     # Handle other HTTP errors
-    if response.status_code >= 400:
-        error_data = response.json() if response.content else {}
+    if status_code >= 400:
+        error_data = json_data if isinstance(json_data, dict) else {}
         raise APIError(
-            error_data.get("error", f"HTTP {response.status_code}"),
-            status_code=response.status_code,
+            error_data.get("error", f"HTTP {status_code}"),
+            status_code=status_code,
             response_data=error_data,
         )
 
-    # Parse response and unwrap API wrapper
-    json_data = response.json()
-
     # Backend wraps response in {code, msg, data} structure
     if isinstance(json_data, dict) and "data" in json_data:
         if json_data.get("code") != 200:
@@ -69,6 +334,9 @@ class HTTPClient:
         headers: Headers,
         timeout: float = 30.0,
         max_retries: int = 3,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool | None = None,
+        cache_ttl: float | None = None,
     ) -> None:
         """Initialize HTTP client.
 
@@ -77,20 +345,25 @@ class HTTPClient:
             headers: Default headers
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
+            limits: Connection pool limits
+            http2: Enable HTTP/2 (defaults to enabled when ``h2`` is installed)
+            cache_ttl: Cache parsed GET responses for this many seconds
+                (disabled when None)
         """
         self.base_url = base_url.rstrip("/")
         self.default_headers = headers
         self.timeout = timeout
         self.max_retries = max_retries
+        self.limits = limits
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._cache = _ResponseCache(cache_ttl) if cache_ttl is not None else None
         self._client: httpx.Client | None = None
+        self._inflight: dict[Hashable, _PendingCall] = {}
+        self._inflight_lock = threading.Lock()
 
     def __enter__(self) -> "HTTPClient":
         """Enter context manager."""
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            headers=self.default_headers,
-            timeout=self.timeout,
-        )
+        self._get_client()
         return self
 
     def __exit__(self, *args: Any) -> None:
@@ -102,10 +375,23 @@ class HTTPClient:
     def _get_client(self) -> httpx.Client:
         """Get or create client instance."""
         if self._client is None:
+            transport_options: dict[str, Any]
+            if _environment_proxies_configured():
+                # Let httpx build its proxy transports from the environment
+                transport_options = {"limits": self.limits, "http2": self.http2}
+            else:
+                transport_options = {
+                    "transport": httpx.HTTPTransport(
+                        limits=self.limits,
+                        http2=self.http2,
+                        retries=CONNECT_RETRIES,
+                    )
+                }
             self._client = httpx.Client(
                 base_url=self.base_url,
                 headers=self.default_headers,
                 timeout=self.timeout,
+                **transport_options,
             )
         return self._client
 
@@ -114,9 +400,12 @@ class HTTPClient:
         method: str,
         path: str,
         **kwargs: Any,
-    ) -> dict[str, Any]:
+    ) -> Any:
         """Make HTTP request with retry logic.
 
+        Identical concurrent GET requests are coalesced into one network call,
+        and GET responses are served from the cache when one is configured.
+
         Args:
             method: HTTP method
             path: API endpoint path
@@ -130,13 +419,107 @@ class HTTPClient:
             APIError: When API returns an error
             NetworkError: When network error occurs
         """
+        key = _request_key(method, path, kwargs)
+        if key is None:
+            return self._send(method, path, None, **kwargs)
+
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not _MISSING:
+                return cached
+
+        # Single flight: the first thread sends the request, later identical
+        # requests wait for its result instead of hitting the API again
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if call is None:
+                call = self._inflight[key] = _PendingCall()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = self._send(method, path, key, **kwargs)
+            return copy.deepcopy(call.result)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            call.done.set()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        cache_key: Hashable | None,
+        revalidate: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a request with retries and cache the parsed result.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            cache_key: Cache key for cacheable requests, None otherwise
+            revalidate: Send conditional headers for a stale cache entry
+            **kwargs: Additional request parameters
+
+        Returns:
+            Response JSON data
+        """
         client = self._get_client()
         last_error: Exception | None = None
+        wait_time = RETRY_BACKOFF_BASE
+
+        # Revalidate a stale cache entry instead of downloading it again
+        request_kwargs = kwargs
+        if revalidate and self._cache is not None and cache_key is not None:
+            conditional = self._cache.conditional_headers(cache_key)
+            if conditional:
+                request_kwargs = {
+                    **kwargs,
+                    "headers": {**(kwargs.get("headers") or {}), **conditional},
+                }
 
         for attempt in range(self.max_retries):
+            retry_after: float | None = None
             try:
-                response = client.request(method, path, **kwargs)
-                return _parse_response(response)
+                response = client.request(method, path, **request_kwargs)
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt == self.max_retries - 1
+                ):
+                    if response.status_code == 304:
+                        if self._cache is not None and cache_key is not None:
+                            cached = self._cache.revalidate(cache_key)
+                            if cached is not _MISSING:
+                                return cached
+                        if request_kwargs is not kwargs:
+                            # The entry was cleared or evicted while the
+                            # request was in flight: fetch the full body
+                            return self._send(
+                                method, path, cache_key, revalidate=False, **kwargs
+                            )
+                        raise APIError(
+                            "Not Modified response without a cached copy", status_code=304
+                        )
+                    data = _parse_response(response)
+                    if self._cache is not None and cache_key is not None:
+                        self._cache.store(cache_key, response, data)
+                    return data
+
+                # Retryable status: honour the server's wait hint, if any
+                retry_after = _parse_retry_after(response.headers)
+                logger.warning(
+                    f"Attempt {attempt + 1}/{self.max_retries} failed: "
+                    f"HTTP {response.status_code}"
+                )
 
             except httpx.TimeoutException as e:
                 last_error = NetworkError(f"Request timeout after {self.timeout}s", e)
@@ -154,11 +537,10 @@ class HTTPClient:
                 logger.error(f"Unexpected error: {e}")
                 break
 
-            # Exponential backoff
+            # Jittered backoff
             if attempt < self.max_retries - 1:
-                wait_time = 2 ** attempt
-                logger.info(f"Retrying in {wait_time}s...")
-                import time
+                wait_time = _backoff_delay(wait_time, retry_after)
+                logger.info(f"Retrying in {wait_time:.2f}s...")
                 time.sleep(wait_time)
 
         # All retries failed
@@ -166,6 +548,27 @@ class HTTPClient:
             raise last_error
         raise NetworkError(f"Request failed after {self.max_retries} attempts", last_error)
 
+    def cache_info(self) -> CacheInfo:
+        """Return response cache statistics (all zero when caching is disabled)."""
+        return self._cache.info() if self._cache is not None else CacheInfo(0, 0, 0, 0)
+
+    def cache_clear(self) -> None:
+        """Drop all cached responses."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def warm_up(self) -> None:
+        """Open a pooled connection ahead of the first real request.
+
+        Sends a cheap HEAD request so the TCP/TLS handshake (and HTTP/2
+        settings exchange) is done up front. Errors are ignored; the next
+        real request will surface them.
+        """
+        try:
+            self._get_client().head("/")
+        except httpx.HTTPError as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+
     def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
@@ -182,6 +585,9 @@ class AsyncHTTPClient:
         headers: Headers,
         timeout: float = 30.0,
         max_retries: int = 3,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool | None = None,
+        cache_ttl: float | None = None,
     ) -> None:
         """Initialize async HTTP client.
 
@@ -190,20 +596,24 @@ class AsyncHTTPClient:
             headers: Default headers
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
+            limits: Connection pool limits
+            http2: Enable HTTP/2 (defaults to enabled when ``h2`` is installed)
+            cache_ttl: Cache parsed GET responses for this many seconds
+                (disabled when None)
         """
         self.base_url = base_url.rstrip("/")
         self.default_headers = headers
         self.timeout = timeout
         self.max_retries = max_retries
+        self.limits = limits
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._cache = _ResponseCache(cache_ttl) if cache_ttl is not None else None
         self._client: httpx.AsyncClient | None = None
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
 
     async def __aenter__(self) -> "AsyncHTTPClient":
         """Enter async context manager."""
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.default_headers,
-            timeout=self.timeout,
-        )
+        self._get_client()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
@@ -215,10 +625,23 @@ class AsyncHTTPClient:
     def _get_client(self) -> httpx.AsyncClient:
         """Get or create client instance."""
         if self._client is None:
+            transport_options: dict[str, Any]
+            if _environment_proxies_configured():
+                # Let httpx build its proxy transports from the environment
+                transport_options = {"limits": self.limits, "http2": self.http2}
+            else:
+                transport_options = {
+                    "transport": httpx.AsyncHTTPTransport(
+                        limits=self.limits,
+                        http2=self.http2,
+                        retries=CONNECT_RETRIES,
+                    )
+                }
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 headers=self.default_headers,
                 timeout=self.timeout,
+                **transport_options,
             )
         return self._client
 
@@ -227,9 +650,12 @@ class AsyncHTTPClient:
         method: str,
         path: str,
         **kwargs: Any,
-    ) -> dict[str, Any]:
+    ) -> Any:
         """Make async HTTP request with retry logic.
 
+        Identical concurrent GET requests are coalesced into one network call,
+        and GET responses are served from the cache when one is configured.
+
         Args:
             method: HTTP method
             path: API endpoint path
@@ -243,13 +669,103 @@ class AsyncHTTPClient:
             APIError: When API returns an error
             NetworkError: When network error occurs
         """
+        key = _request_key(method, path, kwargs)
+        if key is None:
+            return await self._send(method, path, None, **kwargs)
+
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not _MISSING:
+                return cached
+
+        # Single flight: the first caller starts the request in a detached task
+        # and every identical request awaits that task. Each caller waits
+        # through shield(), so cancelling one caller never cancels the request
+        # the others are waiting for.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(method, path, key, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._inflight_done, key))
+        # Every caller gets its own copy, so mutating one result never changes
+        # what the others see
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _inflight_done(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        """Forget a finished in-flight request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        cache_key: Hashable | None,
+        revalidate: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a request with retries and cache the parsed result.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            cache_key: Cache key for cacheable requests, None otherwise
+            revalidate: Send conditional headers for a stale cache entry
+            **kwargs: Additional request parameters
+
+        Returns:
+            Response JSON data
+        """
         client = self._get_client()
         last_error: Exception | None = None
+        wait_time = RETRY_BACKOFF_BASE
+
+        # Revalidate a stale cache entry instead of downloading it again
+        request_kwargs = kwargs
+        if revalidate and self._cache is not None and cache_key is not None:
+            conditional = self._cache.conditional_headers(cache_key)
+            if conditional:
+                request_kwargs = {
+                    **kwargs,
+                    "headers": {**(kwargs.get("headers") or {}), **conditional},
+                }
 
         for attempt in range(self.max_retries):
+            retry_after: float | None = None
             try:
-                response = await client.request(method, path, **kwargs)
-                return _parse_response(response)
+                response = await client.request(method, path, **request_kwargs)
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt == self.max_retries - 1
+                ):
+                    if response.status_code == 304:
+                        if self._cache is not None and cache_key is not None:
+                            cached = self._cache.revalidate(cache_key)
+                            if cached is not _MISSING:
+                                return cached
+                        if request_kwargs is not kwargs:
+                            # The entry was cleared or evicted while the
+                            # request was in flight: fetch the full body
+                            return await self._send(
+                                method, path, cache_key, revalidate=False, **kwargs
+                            )
+                        raise APIError(
+                            "Not Modified response without a cached copy", status_code=304
+                        )
+                    data = _parse_response(response)
+                    if self._cache is not None and cache_key is not None:
+                        self._cache.store(cache_key, response, data)
+                    return data
+
+                # Retryable status: honour the server's wait hint, if any
+                retry_after = _parse_retry_after(response.headers)
+                logger.warning(
+                    f"Attempt {attempt + 1}/{self.max_retries} failed: "
+                    f"HTTP {response.status_code}"
+                )
 
             except httpx.TimeoutException as e:
                 last_error = NetworkError(f"Request timeout after {self.timeout}s", e)
@@ -267,10 +783,10 @@ class AsyncHTTPClient:
                 logger.error(f"Unexpected error: {e}")
                 break
 
-            # Exponential backoff
+            # Jittered backoff
             if attempt < self.max_retries - 1:
-                wait_time = 2 ** attempt
-                logger.info(f"Retrying in {wait_time}s...")
+                wait_time = _backoff_delay(wait_time, retry_after)
+                logger.info(f"Retrying in {wait_time:.2f}s...")
                 await asyncio.sleep(wait_time)
 
         # All retries failed
@@ -278,6 +794,27 @@ class AsyncHTTPClient:
             raise last_error
         raise NetworkError(f"Request failed after {self.max_retries} attempts", last_error)
 
+    def cache_info(self) -> CacheInfo:
+        """Return response cache statistics (all zero when caching is disabled)."""
+        return self._cache.info() if self._cache is not None else CacheInfo(0, 0, 0, 0)
+
+    def cache_clear(self) -> None:
+        """Drop all cached responses."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection ahead of the first real request.
+
+        Sends a cheap HEAD request so the TCP/TLS handshake (and HTTP/2
+        settings exchange) is done up front. Errors are ignored; the next
+        real request will surface them.
+        """
+        try:
+            await self._get_client().head("/")
+        except httpx.HTTPError as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
@@ -0,0 +1,59 @@
+"""JSON encoding/decoding with optional orjson acceleration."""
+
+import json
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+__all__ = ["ORJSON_AVAILABLE", "JSONDecodeError", "json_dumps", "json_loads"]
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+# orjson is optional (``pip install serpshot[orjson]``); it decodes bytes
+# straight to Python objects in a single C pass.
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(content: bytes) -> Any:
+    """Decode a JSON document from raw response bytes.
+
+    Uses orjson when installed, otherwise pydantic-core's Rust parser (always
+    available with pydantic v2, and about twice as fast as the stdlib parser).
+
+    Args:
+        content: UTF-8 encoded JSON bytes
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        JSONDecodeError: If the content is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    try:
+        return from_json(content)
+    except ValueError as e:
+        raise JSONDecodeError(str(e), "", 0) from e
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode an object as compact UTF-8 JSON bytes for a request body.
+
+    Uses orjson when installed, otherwise pydantic-core's Rust encoder.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return to_json(obj)
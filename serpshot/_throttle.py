@@ -0,0 +1,84 @@
+"""Rate limiting helpers for running many async requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+__all__ = ["throttled_map"]
+
+T = TypeVar("T")
+
+
+async def throttled_map(
+    fn: Callable[..., Awaitable[T]],
+    items: Iterable[Any],
+    *,
+    max_per_second: float,
+    max_at_once: int,
+    **kwargs: Any,
+) -> list[T]:
+    """Call an async function for each item with rate and concurrency limits.
+
+    Combines a token bucket (at most ``max_per_second`` calls started per
+    second) with a concurrency cap (at most ``max_at_once`` calls in flight).
+
+    Args:
+        fn: Async callable invoked as ``fn(item, **kwargs)``
+        items: Items to process
+        max_per_second: Maximum number of calls started per second
+        max_at_once: Maximum number of calls running concurrently
+        **kwargs: Extra keyword arguments passed to every call
+
+    Returns:
+        Results in the same order as ``items``
+
+    Raises:
+        ValueError: If a limit is not positive
+        Exception: The first error raised by ``fn``; calls still running or
+            waiting are cancelled
+
+    Example:
+        >>> async with AsyncSerpShot(api_key="your-api-key") as client:
+        ...     responses = await throttled_map(
+        ...         client.search,
+        ...         ["Python", "Rust", "Go"],
+        ...         max_per_second=2,
+        ...         max_at_once=2,
+        ...         num=5,
+        ...     )
+    """
+    if max_per_second <= 0:
+        raise ValueError("max_per_second must be positive")
+    if max_at_once < 1:
+        raise ValueError("max_at_once must be at least 1")
+
+    items = list(items)
+    if not items:
+        return []
+
+    semaphore = asyncio.Semaphore(max_at_once)
+    # Bucket size allows up to one second worth of calls to burst after idling
+    tokens: asyncio.Queue[None] = asyncio.Queue(maxsize=max(1, int(max_per_second)))
+    interval = 1.0 / max_per_second
+
+    async def refill() -> None:
+        while True:
+            await tokens.put(None)
+            await asyncio.sleep(interval)
+
+    async def run(item: Any) -> T:
+        async with semaphore:
+            await tokens.get()
+            return await fn(item, **kwargs)
+
+    refiller = asyncio.create_task(refill())
+    tasks = [asyncio.create_task(run(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        # gather() does not cancel the remaining calls when one fails; stop
+        # them so no task waits on the bucket forever or keeps spending credits
+        pending = [task for task in (refiller, *tasks) if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -1,10 +1,14 @@
 """Asynchronous SerpShot API client."""
 
-from typing import Any
+import asyncio
+from typing import Any, ClassVar, cast
 
-from ._base import BaseClient
-from ._http import AsyncHTTPClient
-from .models import SearchResponse
+import httpx
+
+from ._base import IMAGE_VALUE, SEARCH_VALUE, BaseClient
+from ._batcher import QueryBatcher
+from ._http import DEFAULT_LIMITS, AsyncHTTPClient, CacheInfo
+from .models import SearchRequest, SearchResponse
 from .types import LocationType, SearchType
 
 __all__ = ["AsyncSerpShot"]
@@ -33,12 +37,24 @@ class AsyncSerpShot(BaseClient):
         ...         print(response.total_results)
     """
 
+    # Seconds search_batched() waits for more queries before sending a batch
+    BATCH_WINDOW = 0.005
+
+    # Responses that may hold at least this many results (queries x num) are
+    # parsed off the event loop; smaller ones are cheaper to parse inline
+    PARSE_IN_THREAD_MIN_RESULTS = 1000
+
+    _shared_instances: ClassVar[dict[str, "AsyncSerpShot"]] = {}
+
     def __init__(
         self,
         api_key: str | None = None,
         base_url: str | None = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool | None = None,
+        cache_ttl: float | None = None,
     ) -> None:
         """Initialize asynchronous SerpShot client.
 
@@ -48,15 +64,55 @@ class AsyncSerpShot(BaseClient):
             base_url: API base URL (optional, defaults to production)
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
+            limits: Connection pool limits (defaults to ``serpshot.DEFAULT_LIMITS``)
+            http2: Enable HTTP/2 so concurrent requests are multiplexed over one
+                connection. Defaults to enabled when ``h2`` is available.
+            cache_ttl: Cache GET responses (e.g. available credits) in memory for
+                this many seconds. Disabled by default.
         """
         super().__init__(api_key, base_url, timeout, max_retries)
         self._http = AsyncHTTPClient(
             base_url=self.base_url,
-            headers=self.auth.get_headers(),
+            headers=self._auth_headers,
             timeout=timeout,
             max_retries=max_retries,
+            limits=limits,
+            http2=http2,
+            cache_ttl=cache_ttl,
+        )
+        self._batcher: QueryBatcher[SearchResponse] = QueryBatcher(
+            self._send_coalesced,
+            window=self.BATCH_WINDOW,
+            max_batch=self.MAX_BATCH_SIZE,
         )
 
+    @classmethod
+    def shared(cls, api_key: str | None = None) -> "AsyncSerpShot":
+        """Return a process-wide client for an API key, created on first use.
+
+        Reusing it keeps one connection pool (and its TLS sessions) alive for
+        the whole application instead of rebuilding it per ``async with``
+        block. Like any httpx async client, it must be used from a single
+        event loop; call ``await AsyncSerpShot.shared().close()`` on shutdown.
+
+        Args:
+            api_key: SerpShot API key. If not provided, will try to read from
+                SERPSHOT_API_KEY environment variable.
+
+        Returns:
+            The shared AsyncSerpShot instance for that key
+
+        Example:
+            >>> async def handler():
+            ...     client = AsyncSerpShot.shared()
+            ...     return await client.search("Python programming")
+        """
+        key = cls._get_api_key(api_key)
+        client = cls._shared_instances.get(key)
+        if client is None:
+            client = cls._shared_instances[key] = cls(api_key=key)
+        return client
+
     async def __aenter__(self) -> "AsyncSerpShot":
         """Enter async context manager."""
         await self._http.__aenter__()
@@ -112,9 +168,9 @@ class AsyncSerpShot(BaseClient):
             ...         print(f"Found {len(resp.results)} results")
             ...     await client.close()
         """
-        params = self._build_search_request_params(
-            query=query,
-            search_type=SearchType.SEARCH,
+        return await self._search(
+            query,
+            SEARCH_VALUE,
             num=num,
             page=page,
             gl=gl,
@@ -123,9 +179,6 @@ class AsyncSerpShot(BaseClient):
             location=location,
         )
 
-        data = await self._http.request("POST", "/api/search/google", json=params)
-        return self._process_search_response(data, query)
-
     async def image_search(
         self,
         query: str | list[str],
@@ -166,9 +219,229 @@ class AsyncSerpShot(BaseClient):
             ...     responses = await client.image_search(["cats", "dogs", "birds"], num=10)
             ...     await client.close()
         """
-        params = self._build_search_request_params(
+        return await self._search(
+            query,
+            IMAGE_VALUE,
+            num=num,
+            page=page,
+            gl=gl,
+            hl=hl,
+            lr=lr,
+            location=location,
+        )
+
+    async def search_batched(
+        self,
+        query: str,
+        *,
+        num: int = 10,
+        page: int = 1,
+        gl: str = "us",
+        hl: str = "en",
+        lr: str = "en",
+        location: str | LocationType | None = None,
+    ) -> SearchResponse:
+        """Perform a single-query search, coalesced with concurrent callers.
+
+        Calls made within BATCH_WINDOW seconds of each other with the same
+        options are sent together as one batch request (up to MAX_BATCH_SIZE
+        queries), so many concurrent single searches cost one round trip.
+
+        Args:
+            query: Search query string
+            num: Number of results to return per page (1-100, default: 10)
+            page: Page number for pagination (starts from 1, default: 1)
+            gl: Country code for results (default: 'us')
+            hl: Interface language code (default: 'en')
+            lr: Content language restriction (default: 'en')
+            location: Location type for local search
+                (e.g., 'US', 'GB', or LocationType.US, default: None)
+
+        Returns:
+            SearchResponse for this query
+
+        Raises:
+            Same exceptions as search(). An invalid query raises ValueError
+            before it joins a batch; an error for the batch itself is raised
+            in every caller that was part of it
+
+        Example:
+            >>> async def example():
+            ...     client = AsyncSerpShot(api_key="your-api-key")
+            ...     responses = await asyncio.gather(
+            ...         *(client.search_batched(q) for q in ["Python", "Rust", "Go"])
+            ...     )
+            ...     await client.close()
+        """
+        # Validate before joining a batch, so one bad query fails only its caller
+        SearchRequest.validate_queries([query])
+        options = {"num": num, "page": page, "gl": gl, "hl": hl, "lr": lr, "location": location}
+        key = (num, page, gl, hl, lr, location)
+        return await self._batcher.submit(query, key, options)
+
+    async def _send_coalesced(
+        self,
+        queries: list[str],
+        options: dict[str, Any],
+    ) -> list[SearchResponse]:
+        """Send one coalesced batch for search_batched()."""
+        return await self._search_batch(queries, SEARCH_VALUE, **options)
+
+    async def search_batch(
+        self,
+        queries: list[str],
+        *,
+        num: int = 10,
+        page: int = 1,
+        gl: str = "us",
+        hl: str = "en",
+        lr: str = "en",
+        location: str | LocationType | None = None,
+        chunk_size: int | None = None,
+    ) -> list[SearchResponse]:
+        """Perform a batch Google search asynchronously.
+
+        Same as search() with a list of queries, but always returns a list,
+        so callers do not need to narrow the return type.
+
+        Args:
+            queries: List of query strings
+            num: Number of results to return per page (1-100, default: 10)
+            page: Page number for pagination (starts from 1, default: 1)
+            gl: Country code for results (default: 'us')
+            hl: Interface language code (default: 'en')
+            lr: Content language restriction (default: 'en')
+            location: Location type for local search
+                (e.g., 'US', 'GB', or LocationType.US, default: None)
+            chunk_size: Queries sent per request (1-100, default: 100). Smaller
+                chunks run as more requests in parallel.
+
+        Returns:
+            One SearchResponse per query, in the same order as ``queries``
+
+        Raises:
+            Same exceptions as search()
+
+        Example:
+            >>> async def example():
+            ...     client = AsyncSerpShot(api_key="your-api-key")
+            ...     responses = await client.search_batch(["Python", "Rust"], num=5)
+            ...     for resp in responses:
+            ...         print(resp.query, len(resp.results))
+            ...     await client.close()
+        """
+        return await self._search_batch(
+            queries,
+            SEARCH_VALUE,
+            num=num,
+            page=page,
+            gl=gl,
+            hl=hl,
+            lr=lr,
+            location=location,
+            chunk_size=chunk_size,
+        )
+
+    async def image_search_batch(
+        self,
+        queries: list[str],
+        *,
+        num: int = 10,
+        page: int = 1,
+        gl: str = "us",
+        hl: str = "en",
+        lr: str = "en",
+        location: str | LocationType | None = None,
+        chunk_size: int | None = None,
+    ) -> list[SearchResponse]:
+        """Perform a batch Google image search asynchronously.
+
+        Same as image_search() with a list of queries, but always returns a list,
+        so callers do not need to narrow the return type.
+
+        Args:
+            queries: List of query strings
+            num: Number of results to return per page (1-100, default: 10)
+            page: Page number for pagination (starts from 1, default: 1)
+            gl: Country code for results (default: 'us')
+            hl: Interface language code (default: 'en')
+            lr: Content language restriction (default: 'en')
+            location: Location type for local search
+                (e.g., 'US', 'GB', or LocationType.US, default: None)
+            chunk_size: Queries sent per request (1-100, default: 100). Smaller
+                chunks run as more requests in parallel.
+
+        Returns:
+            One SearchResponse per query, in the same order as ``queries``
+
+        Raises:
+            Same exceptions as search()
+
+        Example:
+            >>> async def example():
+            ...     client = AsyncSerpShot(api_key="your-api-key")
+            ...     responses = await client.image_search_batch(["Python", "Rust"], num=5)
+            ...     for resp in responses:
+            ...         print(resp.query, len(resp.results))
+            ...     await client.close()
+        """
+        return await self._search_batch(
+            queries,
+            IMAGE_VALUE,
+            num=num,
+            page=page,
+            gl=gl,
+            hl=hl,
+            lr=lr,
+            location=location,
+            chunk_size=chunk_size,
+        )
+
+    async def search_raw(
+        self,
+        query: str | list[str],
+        *,
+        search_type: SearchType | str = SearchType.SEARCH,
+        num: int = 10,
+        page: int = 1,
+        gl: str = "us",
+        hl: str = "en",
+        lr: str = "en",
+        location: str | LocationType | None = None,
+    ) -> list[dict[str, Any]]:
+        """Perform a search asynchronously and return the decoded API data.
+
+        Skips SearchResponse validation entirely, for callers that only iterate
+        over results. Items keep the backend's field names (e.g. ``imageUrl``
+        for image results) and no defaults are filled in.
+
+        Args:
+            query: Search query string or list of query strings (max 100)
+            search_type: SearchType.SEARCH or SearchType.IMAGE (default: SEARCH)
+            num: Number of results to return per page (1-100, default: 10)
+            page: Page number for pagination (starts from 1, default: 1)
+            gl: Country code for results (default: 'us')
+            hl: Interface language code (default: 'en')
+            lr: Content language restriction (default: 'en')
+            location: Location type for local search
+                (e.g., 'US', 'GB', or LocationType.US, default: None)
+
+        Returns:
+            One dict per query with ``search_params``, ``search_info`` and
+            ``results`` keys, as returned by the API
+
+        Raises:
+            Same exceptions as search()
+
+        Example:
+            >>> async with AsyncSerpShot(api_key="your-api-key") as client:
+            ...     data = await client.search_raw("Python")
+            ...     for item in data[0]["results"]:
+            ...         print(item["title"], item["link"])
+        """
+        body = self._build_search_request_body(
             query=query,
-            search_type=SearchType.IMAGE,
+            search_type=SearchType(search_type).value,
             num=num,
             page=page,
             gl=gl,
@@ -176,10 +449,62 @@ class AsyncSerpShot(BaseClient):
             lr=lr,
             location=location,
         )
+        data = await self._http.request("POST", "/api/search/google", content=body)
+        if data is None:
+            return []
+        return data if isinstance(data, list) else [data]
+
+    async def _search(
+        self,
+        query: str | list[str],
+        search_type: str,
+        chunk_size: int | None = None,
+        **options: Any,
+    ) -> SearchResponse | list[SearchResponse]:
+        """Run a search, splitting oversized batches into concurrent requests.
 
-        data = await self._http.request("POST", "/api/search/google", json=params)
+        Args:
+            query: Search query string or list of query strings
+            search_type: Search type value (SEARCH_VALUE or IMAGE_VALUE)
+            chunk_size: Queries per request for list queries (default: MAX_BATCH_SIZE)
+            **options: Search parameters forwarded to the request builder
+
+        Returns:
+            SearchResponse for single query, list[SearchResponse] for batch queries
+        """
+        size = self._resolve_chunk_size(chunk_size)
+        if isinstance(query, list) and len(query) > size:
+            chunk_responses = await asyncio.gather(
+                *(
+                    self._search_batch(chunk, search_type, **options)
+                    for chunk in self._chunk_queries(query, size)
+                )
+            )
+            return [response for chunk in chunk_responses for response in chunk]
+
+        body = self._build_search_request_body(
+            query=query,
+            search_type=search_type,
+            **options,
+        )
+
+        data = await self._http.request("POST", "/api/search/google", content=body)
+        # Validating large batches takes milliseconds; do it in a worker thread
+        # so other requests on the event loop are not stalled meanwhile
+        num_queries = 1 if isinstance(query, str) else len(query)
+        if num_queries * options.get("num", 10) >= self.PARSE_IN_THREAD_MIN_RESULTS:
+            return await asyncio.to_thread(self._process_search_response, data, query)
         return self._process_search_response(data, query)
 
+    async def _search_batch(
+        self,
+        queries: list[str],
+        search_type: str,
+        **options: Any,
+    ) -> list[SearchResponse]:
+        """Run a single batch request that fits within MAX_BATCH_SIZE."""
+        return cast(list[SearchResponse], await self._search(queries, search_type, **options))
+
     async def get_available_credits(self) -> int:
         """Get available credits for the account asynchronously.
 
@@ -201,6 +526,34 @@ class AsyncSerpShot(BaseClient):
         data = await self._http.request("GET", "/api/credit/record/available_credits")
         return int(data) if isinstance(data, (int, str)) else data
 
+    def cache_info(self) -> CacheInfo:
+        """Get response cache statistics.
+
+        Returns:
+            CacheInfo with hits, misses, maxsize and currsize (all zero when
+            the client was created without ``cache_ttl``)
+        """
+        return self._http.cache_info()
+
+    def cache_clear(self) -> None:
+        """Drop all cached responses."""
+        self._http.cache_clear()
+
+    async def warm_up(self) -> None:
+        """Establish a connection to the API before the first search.
+
+        Moves the TCP/TLS handshake (and HTTP/2 settings exchange) off the
+        critical path, so requests started together afterwards share a warm
+        connection. Failures are ignored and surface on the next request.
+
+        Example:
+            >>> async def example():
+            ...     async with AsyncSerpShot(api_key="your-api-key") as client:
+            ...         await client.warm_up()
+            ...         response = await client.search("Python programming")
+        """
+        await self._http.warm_up()
+
     async def close(self) -> None:
         """Close the client and cleanup resources.
 
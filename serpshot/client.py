@@ -1,14 +1,21 @@
 """Synchronous SerpShot API client."""
 
-from typing import Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, cast
 
-from ._base import BaseClient
-from ._http import HTTPClient
+import httpx
+
+from ._base import IMAGE_VALUE, SEARCH_VALUE, BaseClient
+from ._http import DEFAULT_LIMITS, CacheInfo, HTTPClient
 from .models import SearchResponse
 from .types import LocationType, SearchType
 
 __all__ = ["SerpShot"]
 
+# Maximum number of batch chunks sent in parallel for oversized query lists
+MAX_BATCH_WORKERS = 4
+
 
 class SerpShot(BaseClient):
     """Synchronous SerpShot API client.
@@ -28,12 +35,18 @@ class SerpShot(BaseClient):
         ...     print(response.total_results)
     """
 
+    _shared_instances: ClassVar[dict[str, "SerpShot"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         api_key: str | None = None,
         base_url: str | None = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool | None = None,
+        cache_ttl: float | None = None,
     ) -> None:
         """Initialize synchronous SerpShot client.
 
@@ -43,15 +56,51 @@ class SerpShot(BaseClient):
             base_url: API base URL (optional, defaults to production)
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
+            limits: Connection pool limits (defaults to ``serpshot.DEFAULT_LIMITS``)
+            http2: Enable HTTP/2 so concurrent requests are multiplexed over one
+                connection. Defaults to enabled when ``h2`` is available.
+            cache_ttl: Cache GET responses (e.g. available credits) in memory for
+                this many seconds. Disabled by default.
         """
         super().__init__(api_key, base_url, timeout, max_retries)
         self._http = HTTPClient(
             base_url=self.base_url,
-            headers=self.auth.get_headers(),
+            headers=self._auth_headers,
             timeout=timeout,
             max_retries=max_retries,
+            limits=limits,
+            http2=http2,
+            cache_ttl=cache_ttl,
         )
 
+    @classmethod
+    def shared(cls, api_key: str | None = None) -> "SerpShot":
+        """Return a process-wide client for an API key, created on first use.
+
+        Reusing it keeps one connection pool (and its TLS sessions) alive for
+        the whole application instead of rebuilding it per ``with`` block.
+        The client is safe to use from multiple threads; call
+        ``SerpShot.shared().close()`` on shutdown.
+
+        Args:
+            api_key: SerpShot API key. If not provided, will try to read from
+                SERPSHOT_API_KEY environment variable.
+
+        Returns:
+            The shared SerpShot instance for that key
+
+        Example:
+            >>> def handler():
+            ...     client = SerpShot.shared()
+            ...     return client.search("Python programming")
+        """
+        key = cls._get_api_key(api_key)
+        with cls._shared_lock:
+            client = cls._shared_instances.get(key)
+            if client is None:
+                client = cls._shared_instances[key] = cls(api_key=key)
+        return client
+
     def __enter__(self) -> "SerpShot":
         """Enter context manager."""
         self._http.__enter__()
@@ -106,9 +155,9 @@ class SerpShot(BaseClient):
             ...     print(f"Found {len(resp.results)} results")
             >>> client.close()
         """
-        params = self._build_search_request_params(
-            query=query,
-            search_type=SearchType.SEARCH,
+        return self._search(
+            query,
+            SEARCH_VALUE,
             num=num,
             page=page,
             gl=gl,
@@ -117,9 +166,6 @@ class SerpShot(BaseClient):
             location=location,
         )
 
-        data = self._http.request("POST", "/api/search/google", json=params)
-        return self._process_search_response(data, query)
-
     def image_search(
         self,
         query: str | list[str],
@@ -159,9 +205,170 @@ class SerpShot(BaseClient):
             >>> responses = client.image_search(["cats", "dogs", "birds"], num=10)
             >>> client.close()
         """
-        params = self._build_search_request_params(
+        return self._search(
+            query,
+            IMAGE_VALUE,
+            num=num,
+            page=page,
+            gl=gl,
+            hl=hl,
+            lr=lr,
+            location=location,
+        )
+
+    def search_batch(
+        self,
+        queries: list[str],
+        *,
+        num: int = 10,
+        page: int = 1,
+        gl: str = "us",
+        hl: str = "en",
+        lr: str = "en",
+        location: str | LocationType | None = None,
+        chunk_size: int | None = None,
+    ) -> list[SearchResponse]:
+        """Perform a batch Google search.
+
+        Same as search() with a list of queries, but always returns a list,
+        so callers do not need to narrow the return type.
+
+        Args:
+            queries: List of query strings
+            num: Number of results to return per page (1-100, default: 10)
+            page: Page number for pagination (starts from 1, default: 1)
+            gl: Country code for results (default: 'us')
+            hl: Interface language code (default: 'en')
+            lr: Content language restriction (default: 'en')
+            location: Location type for local search
+                (e.g., 'US', 'GB', or LocationType.US, default: None)
+            chunk_size: Queries sent per request (1-100, default: 100). Smaller
+                chunks run as more requests in parallel.
+
+        Returns:
+            One SearchResponse per query, in the same order as ``queries``
+
+        Raises:
+            Same exceptions as search()
+
+        Example:
+            >>> client = SerpShot(api_key="your-api-key")
+            >>> responses = client.search_batch(["Python", "Rust"], num=5)
+            >>> for resp in responses:
+            ...     print(resp.query, len(resp.results))
+            >>> client.close()
+        """
+        return self._search_batch(
+            queries,
+            SEARCH_VALUE,
+            num=num,
+            page=page,
+            gl=gl,
+            hl=hl,
+            lr=lr,
+            location=location,
+            chunk_size=chunk_size,
+        )
+
+    def image_search_batch(
+        self,
+        queries: list[str],
+        *,
+        num: int = 10,
+        page: int = 1,
+        gl: str = "us",
+        hl: str = "en",
+        lr: str = "en",
+        location: str | LocationType | None = None,
+        chunk_size: int | None = None,
+    ) -> list[SearchResponse]:
+        """Perform a batch Google image search.
+
+        Same as image_search() with a list of queries, but always returns a list,
+        so callers do not need to narrow the return type.
+
+        Args:
+            queries: List of query strings
+            num: Number of results to return per page (1-100, default: 10)
+            page: Page number for pagination (starts from 1, default: 1)
+            gl: Country code for results (default: 'us')
+            hl: Interface language code (default: 'en')
+            lr: Content language restriction (default: 'en')
+            location: Location type for local search
+                (e.g., 'US', 'GB', or LocationType.US, default: None)
+            chunk_size: Queries sent per request (1-100, default: 100). Smaller
+                chunks run as more requests in parallel.
+
+        Returns:
+            One SearchResponse per query, in the same order as ``queries``
+
+        Raises:
+            Same exceptions as search()
+
+        Example:
+            >>> client = SerpShot(api_key="your-api-key")
+            >>> responses = client.image_search_batch(["Python", "Rust"], num=5)
+            >>> for resp in responses:
+            ...     print(resp.query, len(resp.results))
+            >>> client.close()
+        """
+        return self._search_batch(
+            queries,
+            IMAGE_VALUE,
+            num=num,
+            page=page,
+            gl=gl,
+            hl=hl,
+            lr=lr,
+            location=location,
+            chunk_size=chunk_size,
+        )
+
+    def search_raw(
+        self,
+        query: str | list[str],
+        *,
+        search_type: SearchType | str = SearchType.SEARCH,
+        num: int = 10,
+        page: int = 1,
+        gl: str = "us",
+        hl: str = "en",
+        lr: str = "en",
+        location: str | LocationType | None = None,
+    ) -> list[dict[str, Any]]:
+        """Perform a search and return the decoded API data without building models.
+
+        Skips SearchResponse validation entirely, for callers that only iterate
+        over results. Items keep the backend's field names (e.g. ``imageUrl``
+        for image results) and no defaults are filled in.
+
+        Args:
+            query: Search query string or list of query strings (max 100)
+            search_type: SearchType.SEARCH or SearchType.IMAGE (default: SEARCH)
+            num: Number of results to return per page (1-100, default: 10)
+            page: Page number for pagination (starts from 1, default: 1)
+            gl: Country code for results (default: 'us')
+            hl: Interface language code (default: 'en')
+            lr: Content language restriction (default: 'en')
+            location: Location type for local search
+                (e.g., 'US', 'GB', or LocationType.US, default: None)
+
+        Returns:
+            One dict per query with ``search_params``, ``search_info`` and
+            ``results`` keys, as returned by the API
+
+        Raises:
+            Same exceptions as search()
+
+        Example:
+            >>> client = SerpShot(api_key="your-api-key")
+            >>> for item in client.search_raw("Python")[0]["results"]:
+            ...     print(item["title"], item["link"])
+            >>> client.close()
+        """
+        body = self._build_search_request_body(
             query=query,
-            search_type=SearchType.IMAGE,
+            search_type=SearchType(search_type).value,
             num=num,
             page=page,
             gl=gl,
@@ -169,10 +376,59 @@ class SerpShot(BaseClient):
             lr=lr,
             location=location,
         )
+        data = self._http.request("POST", "/api/search/google", content=body)
+        if data is None:
+            return []
+        return data if isinstance(data, list) else [data]
+
+    def _search(
+        self,
+        query: str | list[str],
+        search_type: str,
+        chunk_size: int | None = None,
+        **options: Any,
+    ) -> SearchResponse | list[SearchResponse]:
+        """Run a search, splitting oversized batches into parallel requests.
+
+        Args:
+            query: Search query string or list of query strings
+            search_type: Search type value (SEARCH_VALUE or IMAGE_VALUE)
+            chunk_size: Queries per request for list queries (default: MAX_BATCH_SIZE)
+            **options: Search parameters forwarded to the request builder
+
+        Returns:
+            SearchResponse for single query, list[SearchResponse] for batch queries
+        """
+        size = self._resolve_chunk_size(chunk_size)
+        if isinstance(query, list) and len(query) > size:
+            chunks = self._chunk_queries(query, size)
+            # Create the shared httpx client up front so worker threads reuse it
+            self._http._get_client()
+            with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_BATCH_WORKERS)) as executor:
+                chunk_responses = executor.map(
+                    lambda chunk: self._search_batch(chunk, search_type, **options),
+                    chunks,
+                )
+                return [response for chunk in chunk_responses for response in chunk]
+
+        body = self._build_search_request_body(
+            query=query,
+            search_type=search_type,
+            **options,
+        )
 
-        data = self._http.request("POST", "/api/search/google", json=params)
+        data = self._http.request("POST", "/api/search/google", content=body)
         return self._process_search_response(data, query)
 
+    def _search_batch(
+        self,
+        queries: list[str],
+        search_type: str,
+        **options: Any,
+    ) -> list[SearchResponse]:
+        """Run a single batch request that fits within MAX_BATCH_SIZE."""
+        return cast(list[SearchResponse], self._search(queries, search_type, **options))
+
     def get_available_credits(self) -> int:
         """Get available credits for the account.
 
@@ -193,6 +449,32 @@ class SerpShot(BaseClient):
         data = self._http.request("GET", "/api/credit/record/available_credits")
         return int(data) if isinstance(data, (int, str)) else data
 
+    def cache_info(self) -> CacheInfo:
+        """Get response cache statistics.
+
+        Returns:
+            CacheInfo with hits, misses, maxsize and currsize (all zero when
+            the client was created without ``cache_ttl``)
+        """
+        return self._http.cache_info()
+
+    def cache_clear(self) -> None:
+        """Drop all cached responses."""
+        self._http.cache_clear()
+
+    def warm_up(self) -> None:
+        """Establish a connection to the API before the first search.
+
+        Moves the TCP/TLS handshake off the critical path of the first real
+        request. Failures are ignored and surface on the next request instead.
+
+        Example:
+            >>> with SerpShot(api_key="your-api-key") as client:
+            ...     client.warm_up()
+            ...     response = client.search("Python programming")
+        """
+        self._http.warm_up()
+
     def close(self) -> None:
         """Close the client and cleanup resources.
 
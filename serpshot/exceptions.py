@@ -13,19 +13,52 @@ __all__ = [
 ]
 
 
+def _restore_error(
+    cls: type["SerpShotError"], args: tuple[Any, ...], state: dict[str, Any]
+) -> "SerpShotError":
+    """Rebuild a pickled error without calling its __init__."""
+    error = cls.__new__(cls, *args)
+    error.args = args
+    for name, value in state.items():
+        setattr(error, name, value)
+    return error
+
+
 class SerpShotError(Exception):
     """Base exception for all SerpShot SDK errors."""
 
+    # Attributes live in slots, so raising an error never allocates an
+    # instance __dict__ (this matters in retry loops)
+    __slots__ = ("message", "status_code")
+
+    message: str
+    status_code: int | None
+
     def __init__(self, message: str, status_code: int | None = None) -> None:
         """Initialize error with message and optional status code."""
         self.message = message
         self.status_code = status_code
         super().__init__(message)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle slot attributes too; the default only keeps args and __dict__.
+
+        Errors then keep ``status_code``, ``retry_after`` etc. when they cross
+        process boundaries (multiprocessing, ProcessPoolExecutor).
+        """
+        state = dict(getattr(self, "__dict__", {}))
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return _restore_error, (type(self), self.args, state)
+
 
 class AuthenticationError(SerpShotError):
     """Raised when API key is invalid or missing."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Invalid or missing API key") -> None:
         """Initialize authentication error."""
         super().__init__(message, status_code=401)
@@ -34,6 +67,8 @@ class AuthenticationError(SerpShotError):
 class RateLimitError(SerpShotError):
     """Raised when rate limit is exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -47,6 +82,8 @@ class RateLimitError(SerpShotError):
 class InsufficientCreditsError(SerpShotError):
     """Raised when account has insufficient credits."""
 
+    __slots__ = ("credits_required", "credits_available")
+
     def __init__(
         self,
         message: str = "Insufficient credits",
@@ -62,6 +99,8 @@ class InsufficientCreditsError(SerpShotError):
 class APIError(SerpShotError):
     """Raised when API returns an error response."""
 
+    __slots__ = ("response_data",)
+
     def __init__(
         self,
         message: str,
@@ -76,6 +115,8 @@ class APIError(SerpShotError):
 class ValidationError(SerpShotError):
     """Raised when request validation fails."""
 
+    __slots__ = ("errors",)
+
     def __init__(self, message: str, errors: dict[str, Any] | None = None) -> None:
         """Initialize validation error."""
         super().__init__(message, status_code=400)
@@ -85,6 +126,8 @@ class ValidationError(SerpShotError):
 class NetworkError(SerpShotError):
     """Raised when network/connection issues occur."""
 
+    __slots__ = ("original_error",)
+
     def __init__(self, message: str, original_error: Exception | None = None) -> None:
         """Initialize network error."""
         super().__init__(message, status_code=None)
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .types import LocationType, SearchType
 
@@ -14,10 +14,17 @@ __all__ = [
     "ErrorResponse",
 ]
 
+# Value -> member lookup for LocationType, avoiding Enum.__call__ and its
+# exception on unknown values
+_LOCATIONS_BY_VALUE: dict[str, LocationType] = {m.value: m for m in LocationType}
+
 
 class SearchRequest(BaseModel):
     """Request model for search API."""
 
+    # Enums are stored as their string values so model_dump() is wire-ready
+    model_config = ConfigDict(use_enum_values=True, frozen=True, extra="forbid")
+
     queries: list[str] = Field(..., min_length=1, max_length=100, description="Search queries")
     type: SearchType = Field(default=SearchType.SEARCH, description="Search type")
     num: int = Field(default=10, ge=1, le=100, description="Number of results per query")
@@ -44,12 +51,10 @@ class SearchRequest(BaseModel):
         if isinstance(v, LocationType):
             return v
         if isinstance(v, str):
-            # Try to convert to enum if it matches, but don't fail if it doesn't
-            try:
-                return LocationType(v.upper())
-            except ValueError:
-                # Not a known enum value, but that's OK - pass it as-is to backend
-                return v.upper()
+            # Use the enum member if it matches; unknown locations are passed
+            # as-is to the backend
+            upper = v.upper()
+            return _LOCATIONS_BY_VALUE.get(upper, upper)
         return v
 
     @field_validator("queries")
@@ -59,6 +64,8 @@ class SearchRequest(BaseModel):
         if not v:
             raise ValueError("At least one query is required")
         for query in v:
+            if not isinstance(query, str):
+                raise ValueError(f"Query must be a string, got {type(query).__name__}")
             if not query or len(query) > 2048:
                 raise ValueError("Query must be between 1 and 2048 characters")
         return v
@@ -1,5 +1,6 @@
 """Type definitions and enumerations for SerpShot SDK."""
 
+from collections.abc import Mapping
 from enum import Enum
 from typing import TypeAlias
 
@@ -41,4 +42,4 @@ class LocationType(str, Enum):
 
 
 # Type aliases
-Headers: TypeAlias = dict[str, str]
+Headers: TypeAlias = Mapping[str, str]
@@ -0,0 +1,62 @@
+"""Shared fixtures for SerpShot SDK tests."""
+
+from pathlib import Path
+
+import pytest
+
+from serpshot import AsyncSerpShot, AuthHandler, SerpShot
+
+TEST_API_KEY = "test-key-12345"
+
+INTEGRATION_DIR = Path(__file__).parent / "integration"
+
+
+def pytest_addoption(parser):
+    """Add the --integration flag for tests that call the real API."""
+    parser.addoption(
+        "--integration",
+        action="store_true",
+        default=False,
+        help="run integration tests against the real API (needs SERPSHOT_API_KEY)",
+    )
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Skip collecting integration tests unless --integration is given."""
+    if not config.getoption("--integration") and collection_path.is_relative_to(
+        INTEGRATION_DIR
+    ):
+        return True
+    return None
+
+
+@pytest.fixture(scope="session")
+def auth():
+    """Provide one valid AuthHandler for tests that only read from it."""
+    return AuthHandler("test-key")
+
+
+@pytest.fixture(scope="session")
+def sync_client():
+    """Provide one SerpShot client for tests that do not reconfigure it."""
+    client = SerpShot(api_key=TEST_API_KEY)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def async_client():
+    """Provide one AsyncSerpShot client for tests that do not reconfigure it.
+
+    Construction is synchronous and the httpx client is created lazily on
+    first use, so one instance can be shared across per-test event loops as
+    long as each test closes what it opens (e.g. via ``async with``).
+    """
+    return AsyncSerpShot(api_key=TEST_API_KEY)
+
+
+@pytest.fixture
+def clean_serpshot_env(monkeypatch):
+    """Unset SERPSHOT_API_KEY for the test; restored automatically afterwards."""
+    monkeypatch.delenv("SERPSHOT_API_KEY", raising=False)
+    return monkeypatch
@@ -0,0 +1,55 @@
+"""Integration tests (require a real API key and credits).
+
+Only collected with ``pytest --integration``.
+"""
+
+import os
+
+import pytest
+
+from serpshot import AsyncSerpShot, SerpShot
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def api_key():
+    """Real API key from the environment."""
+    key = os.getenv("SERPSHOT_API_KEY")
+    if not key:
+        pytest.skip("SERPSHOT_API_KEY not set")
+    return key
+
+
+class TestIntegration:
+    """Integration tests (require real API key)."""
+
+    def test_real_search(self, api_key):
+        """Test real API search (requires API key)."""
+        with SerpShot(api_key=api_key) as client:
+            response = client.search("Python", num=5)
+            assert response.success
+            assert len(response.results) > 0
+
+    def test_real_search_from_env_var(self, api_key):
+        """Test real API search using environment variable."""
+        with SerpShot() as client:
+            response = client.search("Python", num=5)
+            assert response.success
+            assert len(response.results) > 0
+
+    @pytest.mark.asyncio
+    async def test_real_async_search(self, api_key):
+        """Test real async API search (requires API key)."""
+        async with AsyncSerpShot(api_key=api_key) as client:
+            response = await client.search("Python", num=5)
+            assert response.success
+            assert len(response.results) > 0
+
+    @pytest.mark.asyncio
+    async def test_real_async_search_from_env_var(self, api_key):
+        """Test real async API search using environment variable."""
+        async with AsyncSerpShot() as client:
+            response = await client.search("Python", num=5)
+            assert response.success
+            assert len(response.results) > 0
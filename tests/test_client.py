@@ -1,50 +1,77 @@
 """Unit tests for SerpShot SDK."""
 
-import os
+import asyncio
+import json
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import httpx
 import pytest
 
 from serpshot import (
+    DEFAULT_LIMITS,
     AsyncSerpShot,
-    AuthHandler,
     AuthenticationError,
+    AuthHandler,
     LocationType,
     SearchType,
     SerpShot,
+    _http,
+    throttled_map,
 )
-from serpshot.models import SearchRequest, SearchResponse
+from serpshot._base import SEARCH_VALUE, BaseClient
+from serpshot._http import AsyncHTTPClient, HTTPClient
+from serpshot.exceptions import APIError, InsufficientCreditsError, RateLimitError
+from serpshot.models import ImageResult, SearchRequest, SearchResponse, SearchResult
 
 
 class TestAuthHandler:
     """Test authentication handler."""
 
-    def test_valid_api_key(self):
+    def test_valid_api_key(self, auth):
         """Test valid API key initialization."""
-        auth = AuthHandler("valid-api-key-12345")
-        assert auth.api_key == "valid-api-key-12345"
+        assert auth.api_key == "test-key"
+        auth.validate()
 
-    def test_empty_api_key_raises_error(self):
-        """Test that empty API key raises error."""
-        with pytest.raises(AuthenticationError):
-            AuthHandler("")
+    @pytest.mark.parametrize("api_key", ["", None, "   "], ids=["empty", "none", "whitespace"])
+    def test_missing_api_key_raises_error(self, api_key):
+        """Test that empty, None or whitespace-only API keys raise error."""
+        with pytest.raises(AuthenticationError, match="required"):
+            AuthHandler(api_key)
 
-    def test_none_api_key_raises_error(self):
-        """Test that None API key raises error."""
-        with pytest.raises(AuthenticationError):
-            AuthHandler(None)
+    @pytest.mark.parametrize("api_key", ["sk+abc/def==", "key:with~symbols"])
+    def test_header_safe_api_key_is_accepted(self, api_key):
+        """Test that any printable ASCII key is accepted and passes validate()."""
+        auth = AuthHandler(api_key)
 
-    def test_whitespace_api_key_raises_error(self):
-        """Test that whitespace-only API key raises error."""
-        with pytest.raises(AuthenticationError):
-            AuthHandler("   ")
+        auth.validate()
+        assert auth.get_headers()["X-API-Key"] == api_key
 
-    def test_get_headers(self):
+    @pytest.mark.parametrize("api_key", ["key with spaces", "key\nnewline", "ключ-12345"])
+    def test_malformed_api_key_raises_error(self, api_key):
+        """Test that keys with characters unsafe for headers fail fast."""
+        with pytest.raises(AuthenticationError, match="format invalid"):
+            AuthHandler(api_key)
+
+    def test_get_headers(self, auth):
         """Test that headers are properly generated."""
-        auth = AuthHandler("test-key")
+        assert auth.get_headers() == {
+            "X-API-Key": "test-key",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+    def test_get_headers_is_cached_and_read_only(self, auth):
+        """Test that headers are built once and cannot be mutated."""
         headers = auth.get_headers()
-        
-        assert headers["X-API-Key"] == "test-key"
-        assert headers["Content-Type"] == "application/json"
-        assert headers["Accept"] == "application/json"
+
+        assert auth.get_headers() is headers
+        with pytest.raises(TypeError):
+            headers["X-API-Key"] = "other"
 
 
 class TestSearchRequest:
@@ -84,57 +111,51 @@ class TestSearchRequest:
         assert request.lr == "zh-CN"
         assert request.location == LocationType.US
 
-    def test_queries_validation(self):
-        """Test queries validation."""
-        # Empty queries list should fail
-        with pytest.raises(ValueError):
-            SearchRequest(queries=[])
-        
-        # Very long query should fail
-        with pytest.raises(ValueError):
-            SearchRequest(queries=["x" * 3000])
-
-    def test_num_validation(self):
-        """Test num parameter validation."""
-        # Too small
-        with pytest.raises(ValueError):
-            SearchRequest(queries=["test"], num=0)
-        
-        # Too large
-        with pytest.raises(ValueError):
-            SearchRequest(queries=["test"], num=101)
+    def test_location_strings_are_normalized(self):
+        """Test that known locations map to the enum and unknown ones pass through."""
+        assert SearchRequest(queries=["q"], location="gb").location == LocationType.GB
+        assert SearchRequest(queries=["q"], location="xx").location == "XX"
 
-    def test_page_validation(self):
-        """Test page parameter validation."""
-        # Page must be >= 1
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"queries": []},
+            {"queries": ["x" * 3000]},
+            {"queries": ["test"], "num": 0},
+            {"queries": ["test"], "num": 101},
+            {"queries": ["test"], "page": 0},
+        ],
+        ids=["empty", "too_long", "num_low", "num_high", "page_low"],
+    )
+    def test_invalid_inputs_raise(self, kwargs):
+        """Test that out-of-range parameters are rejected."""
         with pytest.raises(ValueError):
-            SearchRequest(queries=["test"], page=0)
+            SearchRequest(**kwargs)
 
 
 class TestBaseClient:
     """Test base client functionality."""
 
-    def test_build_search_params(self):
+    def test_build_search_params(self, sync_client):
         """Test search parameter building."""
-        client = SerpShot(api_key="test-key-12345")
-        
-        params = client._build_search_params(
+        body = sync_client._build_search_request_body(
             query="test",
-            search_type=SearchType.SEARCH,
+            search_type=SEARCH_VALUE,
             num=20,
             gl="us",
         )
-        
+        params = json.loads(body)
+
         assert params["queries"] == ["test"]
         assert params["type"] == "search"
         assert params["num"] == 20
         assert params["gl"] == "us"
         assert params["page"] == 1
 
-    def test_calculate_credits(self):
+    def test_calculate_credits(self, sync_client):
         """Test credit calculation logic."""
-        client = SerpShot(api_key="test-key-12345")
-        
+        client = sync_client
+
         # Base search
         credits = client._calculate_credits(SearchType.SEARCH, 10)
         assert credits == 1
@@ -147,6 +168,60 @@ class TestBaseClient:
         credits = client._calculate_credits(SearchType.SEARCH, 30)
         assert credits == 3
 
+        # Premium regions match regardless of case
+        assert client._calculate_credits(SearchType.SEARCH, 100, "US") == 12
+        assert client._calculate_credits(SearchType.SEARCH, 100, "uS") == 12
+        assert client._calculate_credits(SearchType.SEARCH, 100, "cn") == 10
+
+    def test_request_prefix_is_reused(self, sync_client):
+        """Test the encoded parameters are cached per parameter combination."""
+        from serpshot._base import _build_request_prefix
+
+        client = sync_client
+        _build_request_prefix.cache_clear()
+
+        args = (SearchType.IMAGE, 10, 1, "US", "en", "lang_en", None)
+        first = json.loads(client._build_search_request_body("a", *args))
+        second = json.loads(client._build_search_request_body(["b", "c"], *args))
+
+        assert first["queries"] == ["a"]
+        assert second["queries"] == ["b", "c"]
+        assert second["type"] == "image"
+        assert _build_request_prefix.cache_info().hits == 1
+
+        with pytest.raises(ValueError):
+            client._build_search_request_body("", *args)
+
+    def test_request_body_matches_model_dump(self, sync_client):
+        """Test the prefix-encoded body decodes to the validated request."""
+        client = sync_client
+        args = (SEARCH_VALUE, 5, 2, "us", "en", "en", "US")
+
+        for query in ("a", ["b", "c \"quoted\""]):
+            body = client._build_search_request_body(query, *args)
+            expected = SearchRequest(
+                queries=[query] if isinstance(query, str) else query,
+                type=SEARCH_VALUE,
+                num=5,
+                page=2,
+                gl="us",
+                hl="en",
+                lr="en",
+                location="US",
+            ).model_dump(exclude_none=True)
+            assert json.loads(body) == expected
+
+        with pytest.raises(ValueError):
+            client._build_search_request_body([], *args)
+
+    def test_non_string_queries_raise_value_error(self, sync_client):
+        """Test that non-str query items are rejected like other bad queries."""
+        with pytest.raises(ValueError, match="must be a string"):
+            sync_client._normalize_queries(["ok", 5])
+
+        with pytest.raises(ValueError, match="must be a string"):
+            sync_client.search(["ok", None])
+
 
 class TestSyncClient:
     """Test synchronous client."""
@@ -162,50 +237,92 @@ class TestSyncClient:
         assert client.timeout == 60.0
         assert client.max_retries == 5
 
-    def test_context_manager(self):
+    def test_context_manager(self, sync_client):
         """Test context manager usage."""
-        with SerpShot(api_key="test-key-12345") as client:
-            assert client is not None
+        with sync_client as client:
+            assert client is sync_client
+            assert client._http._client is not None
+        assert client._http._client is None
 
-    def test_initialization_without_api_key_raises_error(self):
-        """Test that initialization without API key raises error when env var is not set."""
-        # Ensure env var is not set
-        original_value = os.environ.pop("SERPSHOT_API_KEY", None)
-        try:
-            with pytest.raises(ValueError, match="API key is required"):
-                SerpShot()
-        finally:
-            # Restore original value if it existed
-            if original_value:
-                os.environ["SERPSHOT_API_KEY"] = original_value
+    def test_connection_pool_settings(self, monkeypatch):
+        """Test that pool limits and HTTP/2 flag reach the HTTP client."""
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+        limits = httpx.Limits(max_connections=5)
+        client = SerpShot(api_key="test-key-12345", limits=limits, http2=False)
 
-    def test_initialization_from_env_var(self):
-        """Test that initialization reads from environment variable."""
-        original_value = os.environ.get("SERPSHOT_API_KEY")
-        try:
-            os.environ["SERPSHOT_API_KEY"] = "env-test-key-12345"
-            client = SerpShot()
-            assert client.auth.api_key == "env-test-key-12345"
-        finally:
-            # Restore original value
-            if original_value:
-                os.environ["SERPSHOT_API_KEY"] = original_value
-            else:
-                os.environ.pop("SERPSHOT_API_KEY", None)
+        assert client._http.limits is limits
+        assert client._http.http2 is False
+        assert SerpShot(api_key="test-key-12345")._http.limits is DEFAULT_LIMITS
 
-    def test_explicit_api_key_overrides_env_var(self):
-        """Test that explicit API key takes precedence over environment variable."""
-        original_value = os.environ.get("SERPSHOT_API_KEY")
+        # Settings reach the connection pool through the transport
+        pool = client._http._get_client()._transport._pool
+        assert pool._max_connections == 5
+        assert pool._retries == _http.CONNECT_RETRIES
+        client.close()
+
+    def test_environment_proxy_is_used(self, monkeypatch):
+        """Test that requests go through HTTP_PROXY when it is set."""
+        seen = []
+
+        class ProxyHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                seen.append(self.path)
+                body = json.dumps({"code": 200, "msg": "ok", "data": 7}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ProxyHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
         try:
-            os.environ["SERPSHOT_API_KEY"] = "env-test-key"
-            client = SerpShot(api_key="explicit-test-key")
-            assert client.auth.api_key == "explicit-test-key"
+            monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{server.server_port}")
+            monkeypatch.delenv("NO_PROXY", raising=False)
+            monkeypatch.delenv("no_proxy", raising=False)
+            with SerpShot(api_key="test-key-12345", base_url="http://api.test") as client:
+                assert client.get_available_credits() == 7
         finally:
-            # Restore original value
-            if original_value:
-                os.environ["SERPSHOT_API_KEY"] = original_value
-            else:
-                os.environ.pop("SERPSHOT_API_KEY", None)
+            server.shutdown()
+            server.server_close()
+
+        # The proxy received the absolute-form URL of the API request
+        assert seen == ["http://api.test/api/credit/record/available_credits"]
+
+    def test_client_methods_can_be_patched(self):
+        """Test that instance attributes (e.g. mock.patch.object) work on clients."""
+        client = SerpShot(api_key="test-key-12345")
+
+        with mock.patch.object(client, "search", return_value="patched"):
+            assert client.search("q") == "patched"
+        with mock.patch.object(AsyncSerpShot(api_key="test-key-12345"), "search"):
+            pass
+        assert client._http.default_headers is client.auth.get_headers()
+
+    def test_shared_client_is_reused(self, monkeypatch):
+        """Test that shared() returns one client per API key across threads."""
+        monkeypatch.setattr(SerpShot, "_shared_instances", {})
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            clients = list(executor.map(lambda _: SerpShot.shared("test-key-12345"), range(8)))
+
+        assert all(c is clients[0] for c in clients)
+        assert SerpShot.shared("other-key-12345") is not clients[0]
+
+    def test_context_manager_reuses_open_client(self):
+        """Test that entering the context keeps an already opened connection pool."""
+        client = SerpShot(api_key="test-key-12345")
+        pool = client._http._get_client()
+
+        with client:
+            assert client._http._client is pool
+        assert pool.is_closed
 
 
 class TestAsyncClient:
@@ -222,50 +339,660 @@ class TestAsyncClient:
         assert client.timeout == 60.0
         assert client.max_retries == 5
 
+    def test_shared_client_is_reused(self, monkeypatch):
+        """Test that shared() lazily creates one client per API key."""
+        monkeypatch.setenv("SERPSHOT_API_KEY", "env-test-key-12345")
+        monkeypatch.setattr(AsyncSerpShot, "_shared_instances", {})
+
+        client = AsyncSerpShot.shared()
+
+        assert AsyncSerpShot.shared() is client
+        assert client.auth.api_key == "env-test-key-12345"
+        assert AsyncSerpShot.shared("env-test-key-12345") is client
+        assert AsyncSerpShot.shared("other-key-12345") is not client
+
     @pytest.mark.asyncio
-    async def test_async_context_manager(self):
+    async def test_async_context_manager(self, async_client):
         """Test async context manager usage."""
-        async with AsyncSerpShot(api_key="test-key-12345") as client:
-            assert client is not None
+        async with async_client as client:
+            assert client is async_client
+            assert client._http._client is not None
+        assert client._http._client is None
 
-    def test_initialization_without_api_key_raises_error(self):
-        """Test that async initialization without API key raises error when env var is not set."""
-        original_value = os.environ.pop("SERPSHOT_API_KEY", None)
-        try:
-            with pytest.raises(ValueError, match="API key is required"):
-                AsyncSerpShot()
-        finally:
-            # Restore original value if it existed
-            if original_value:
-                os.environ["SERPSHOT_API_KEY"] = original_value
 
-    def test_initialization_from_env_var(self):
-        """Test that async initialization reads from environment variable."""
-        original_value = os.environ.get("SERPSHOT_API_KEY")
-        try:
-            os.environ["SERPSHOT_API_KEY"] = "env-test-key-12345"
-            client = AsyncSerpShot()
-            assert client.auth.api_key == "env-test-key-12345"
-        finally:
-            # Restore original value
-            if original_value:
-                os.environ["SERPSHOT_API_KEY"] = original_value
-            else:
-                os.environ.pop("SERPSHOT_API_KEY", None)
+@pytest.mark.parametrize("client_cls", [SerpShot, AsyncSerpShot])
+class TestClientEnv:
+    """Test API key resolution from the environment for both clients."""
 
-    def test_explicit_api_key_overrides_env_var(self):
+    def test_initialization_without_api_key_raises_error(self, client_cls, clean_serpshot_env):
+        """Test that initialization without API key raises error when env var is not set."""
+        with pytest.raises(ValueError, match="API key is required"):
+            client_cls()
+
+    def test_initialization_from_env_var(self, client_cls, clean_serpshot_env):
+        """Test that initialization reads from environment variable."""
+        clean_serpshot_env.setenv("SERPSHOT_API_KEY", "env-test-key-12345")
+
+        assert client_cls().auth.api_key == "env-test-key-12345"
+
+    def test_explicit_api_key_overrides_env_var(self, client_cls, clean_serpshot_env):
         """Test that explicit API key takes precedence over environment variable."""
-        original_value = os.environ.get("SERPSHOT_API_KEY")
-        try:
-            os.environ["SERPSHOT_API_KEY"] = "env-test-key"
-            client = AsyncSerpShot(api_key="explicit-test-key")
-            assert client.auth.api_key == "explicit-test-key"
-        finally:
-            # Restore original value
-            if original_value:
-                os.environ["SERPSHOT_API_KEY"] = original_value
-            else:
-                os.environ.pop("SERPSHOT_API_KEY", None)
+        clean_serpshot_env.setenv("SERPSHOT_API_KEY", "env-test-key")
+
+        assert client_cls(api_key="explicit-test-key").auth.api_key == "explicit-test-key"
+
+
+def _mock_transport(responses):
+    """Build a transport that replays the given responses in order."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return responses[len(calls) - 1]
+
+    return httpx.MockTransport(handler), calls
+
+
+class TestRetry:
+    """Test retry and backoff in the HTTP layer."""
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        """Make backoff sleeps instant."""
+        monkeypatch.setattr(_http, "RETRY_BACKOFF_BASE", 0.0)
+
+    def test_parse_retry_after_seconds_and_date(self):
+        """Test Retry-After parsing for both supported formats."""
+        assert _http._parse_retry_after(httpx.Headers({"Retry-After": "3"})) == 3.0
+        assert _http._parse_retry_after(
+            httpx.Headers({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        ) == 0.0
+        assert _http._parse_retry_after(httpx.Headers({"X-RateLimit-Reset": "5"})) == 5.0
+        assert _http._parse_retry_after(httpx.Headers()) is None
+
+    def test_backoff_respects_server_hint(self):
+        """Test that the server wait hint is a lower bound for the delay."""
+        assert _http._backoff_delay(0, retry_after=2.0) == 2.0
+
+    def test_backoff_is_jittered_and_capped(self, monkeypatch):
+        """Test that delays stay between the base and the cap."""
+        monkeypatch.setattr(_http, "RETRY_BACKOFF_BASE", 0.25)
+        delay = 0.25
+        for _ in range(20):
+            delay = _http._backoff_delay(delay)
+            assert 0.25 <= delay <= _http.RETRY_BACKOFF_CAP
+
+    def test_retries_rate_limited_request(self):
+        """Test that a 429 is retried and the next success is returned."""
+        transport, calls = _mock_transport([
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"code": 200, "msg": "ok", "data": 42}),
+        ])
+        http = HTTPClient("https://api.test", {}, max_retries=3)
+        http._client = httpx.Client(base_url="https://api.test", transport=transport)
+
+        assert http.request("GET", "/credits") == 42
+        assert len(calls) == 2
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the last retryable error is raised once attempts run out."""
+        transport, calls = _mock_transport([httpx.Response(503)] * 2)
+        http = HTTPClient("https://api.test", {}, max_retries=2)
+        http._client = httpx.Client(base_url="https://api.test", transport=transport)
+
+        with pytest.raises(APIError) as exc_info:
+            http.request("GET", "/credits")
+        assert exc_info.value.status_code == 503
+        assert len(calls) == 2
+
+    def test_client_errors_are_not_retried(self):
+        """Test that 4xx errors other than 429 fail immediately."""
+        transport, calls = _mock_transport([httpx.Response(400, json={"error": "bad"})])
+        http = HTTPClient("https://api.test", {}, max_retries=3)
+        http._client = httpx.Client(base_url="https://api.test", transport=transport)
+
+        with pytest.raises(APIError):
+            http.request("GET", "/credits")
+        assert len(calls) == 1
+
+    def test_errors_store_attributes_in_slots(self):
+        """Test that error attributes do not populate an instance __dict__."""
+        error = RateLimitError("slow down", retry_after=5)
+
+        assert (error.message, error.status_code, error.retry_after) == ("slow down", 429, 5)
+        assert error.__dict__ == {}
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            RateLimitError("slow down", retry_after=5),
+            InsufficientCreditsError(credits_required=10, credits_available=3),
+            APIError("boom", status_code=503, response_data={"error": "down"}),
+        ],
+        ids=lambda e: type(e).__name__,
+    )
+    def test_errors_survive_pickling(self, error):
+        """Test that slot attributes survive a pickle round-trip."""
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is type(error)
+        assert restored.args == error.args
+        for klass in type(error).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                assert getattr(restored, name) == getattr(error, name)
+
+    def test_non_json_bodies_raise_api_error(self):
+        """Test that HTML error pages and garbled bodies surface as APIError."""
+        transport, _ = _mock_transport([
+            httpx.Response(404, text="<html>Not Found</html>"),
+            httpx.Response(200, text="<html>maintenance</html>"),
+        ])
+        http = HTTPClient("https://api.test", {}, max_retries=1)
+        http._client = httpx.Client(base_url="https://api.test", transport=transport)
+
+        with pytest.raises(APIError) as exc_info:
+            http.request("GET", "/credits")
+        assert exc_info.value.status_code == 404
+
+        with pytest.raises(APIError, match="Invalid JSON"):
+            http.request("GET", "/credits")
+
+    @pytest.mark.asyncio
+    async def test_async_retries_rate_limited_request(self):
+        """Test that the async client retries a 429 as well."""
+        transport, calls = _mock_transport([
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(429, headers={"Retry-After": "0"}),
+        ])
+        http = AsyncHTTPClient("https://api.test", {}, max_retries=2)
+        http._client = httpx.AsyncClient(base_url="https://api.test", transport=transport)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await http.request("GET", "/credits")
+        assert exc_info.value.retry_after == 0
+        assert len(calls) == 2
+
+
+def _echo_search_transport():
+    """Build a transport that answers each search with one result per query."""
+    calls = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        calls.append(body["queries"])
+        data = [
+            {"search_params": {"q": q, "type": body["type"]}, "results": []}
+            for q in body["queries"]
+        ]
+        return httpx.Response(200, json={"code": 200, "msg": "ok", "data": data})
+
+    return httpx.MockTransport(handler), calls
+
+
+class TestBatchChunking:
+    """Test automatic splitting of oversized query batches."""
+
+    def test_chunk_queries(self):
+        """Test that query lists are split at MAX_BATCH_SIZE."""
+        chunks = SerpShot._chunk_queries([str(i) for i in range(250)])
+
+        assert [len(c) for c in chunks] == [100, 100, 50]
+
+    def test_sync_search_splits_large_batches(self):
+        """Test that the sync client sends one request per chunk, in order."""
+        transport, calls = _echo_search_transport()
+        client = SerpShot(api_key="test-key-12345")
+        client._http._client = httpx.Client(base_url="https://api.test", transport=transport)
+        queries = [f"query {i}" for i in range(150)]
+
+        responses = client.search(queries)
+
+        assert sorted(len(c) for c in calls) == [50, 100]
+        assert [r.query for r in responses] == queries
+
+    def test_search_batch_returns_list(self):
+        """Test that search_batch always returns a list, even for one query."""
+        transport, calls = _echo_search_transport()
+        client = SerpShot(api_key="test-key-12345")
+        client._http._client = httpx.Client(base_url="https://api.test", transport=transport)
+
+        responses = client.search_batch(["only query"])
+
+        assert isinstance(responses, list)
+        assert [r.query for r in responses] == ["only query"]
+
+    @pytest.mark.asyncio
+    async def test_async_search_splits_large_batches(self):
+        """Test that the async client sends one request per chunk, in order."""
+        transport, calls = _echo_search_transport()
+        client = AsyncSerpShot(api_key="test-key-12345")
+        client._http._client = httpx.AsyncClient(
+            base_url="https://api.test", transport=transport
+        )
+        queries = [f"query {i}" for i in range(201)]
+
+        responses = await client.image_search(queries)
+
+        assert sorted(len(c) for c in calls) == [1, 100, 100]
+        assert [r.query for r in responses] == queries
+
+    @pytest.mark.asyncio
+    async def test_async_search_batch_chunk_size(self):
+        """Test that chunk_size controls how many queries go in each request."""
+        transport, calls = _echo_search_transport()
+        client = AsyncSerpShot(api_key="test-key-12345")
+        client._http._client = httpx.AsyncClient(
+            base_url="https://api.test", transport=transport
+        )
+        queries = [f"query {i}" for i in range(60)]
+
+        responses = await client.search_batch(queries, chunk_size=25)
+
+        assert sorted(len(c) for c in calls) == [10, 25, 25]
+        assert [r.query for r in responses] == queries
+
+        with pytest.raises(ValueError, match="chunk_size"):
+            await client.search_batch(queries, chunk_size=101)
+
+    def test_search_raw_returns_api_data(self):
+        """Test that search_raw returns the decoded data without models."""
+        transport, calls = _echo_search_transport()
+        client = SerpShot(api_key="test-key-12345")
+        client._http._client = httpx.Client(base_url="https://api.test", transport=transport)
+
+        data = client.search_raw(["a", "b"], search_type="image")
+
+        assert calls == [["a", "b"]]
+        assert data == [
+            {"search_params": {"q": "a", "type": "image"}, "results": []},
+            {"search_params": {"q": "b", "type": "image"}, "results": []},
+        ]
+
+
+class TestSearchBatched:
+    """Test coalescing of concurrent single-query searches."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self):
+        """Test that concurrent calls with equal options become one batch."""
+        transport, calls = _echo_search_transport()
+        client = AsyncSerpShot(api_key="test-key-12345")
+        client._http._client = httpx.AsyncClient(
+            base_url="https://api.test", transport=transport
+        )
+
+        responses = await asyncio.gather(
+            *(client.search_batched(q) for q in ["a", "b", "c"]),
+            client.search_batched("d", num=20),
+        )
+
+        assert [r.query for r in responses] == ["a", "b", "c", "d"]
+        assert sorted(calls) == [["a", "b", "c"], ["d"]]
+
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_caller(self):
+        """Test that a failed batch raises in each waiting caller."""
+        transport, _ = _mock_transport([httpx.Response(400, json={"error": "bad"})])
+        client = AsyncSerpShot(api_key="test-key-12345")
+        client._http._client = httpx.AsyncClient(
+            base_url="https://api.test", transport=transport
+        )
+
+        results = await asyncio.gather(
+            client.search_batched("a"),
+            client.search_batched("b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, APIError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_invalid_query_fails_only_its_caller(self):
+        """Test that a bad query is rejected before it joins a batch."""
+        transport, calls = _echo_search_transport()
+        client = AsyncSerpShot(api_key="test-key-12345")
+        client._http._client = httpx.AsyncClient(
+            base_url="https://api.test", transport=transport
+        )
+
+        results = await asyncio.gather(
+            client.search_batched("a"),
+            client.search_batched(""),
+            client.search_batched("b"),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[1], ValueError)
+        assert [r.query for r in (results[0], results[2])] == ["a", "b"]
+        assert calls == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_short_batch_result_does_not_hang_callers(self):
+        """Test that callers without a result get an error instead of waiting forever."""
+        from serpshot._batcher import QueryBatcher
+
+        async def send(queries, options):
+            return queries[:1]
+
+        batcher = QueryBatcher(send, window=0)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.submit("a", None, {}),
+                batcher.submit("b", None, {}),
+                return_exceptions=True,
+            ),
+            timeout=1,
+        )
+
+        assert results[0] == "a"
+        assert isinstance(results[1], RuntimeError)
+
+
+class TestResponseCache:
+    """Test the opt-in TTL cache for GET responses."""
+
+    def _client(self, responses, **kwargs):
+        transport, calls = _mock_transport(responses)
+        client = SerpShot(api_key="test-key-12345", **kwargs)
+        client._http._client = httpx.Client(base_url="https://api.test", transport=transport)
+        return client, calls
+
+    def test_get_responses_are_cached(self):
+        """Test that repeated GETs are served from the cache."""
+        client, calls = self._client(
+            [httpx.Response(200, json={"code": 200, "msg": "ok", "data": 7})],
+            cache_ttl=60,
+        )
+
+        assert client.get_available_credits() == 7
+        assert client.get_available_credits() == 7
+        assert len(calls) == 1
+        assert client.cache_info().hits == 1
+
+        client.cache_clear()
+        assert client.cache_info().currsize == 0
+
+    def test_stale_entries_are_revalidated_with_etag(self):
+        """Test that an expired entry is revalidated with If-None-Match."""
+        client, calls = self._client(
+            [
+                httpx.Response(
+                    200,
+                    headers={"ETag": '"v1"'},
+                    json={"code": 200, "msg": "ok", "data": 7},
+                ),
+                httpx.Response(304),
+            ],
+            cache_ttl=0,
+        )
+
+        assert client.get_available_credits() == 7
+        assert client.get_available_credits() == 7
+        assert len(calls) == 2
+        assert calls[1].headers["If-None-Match"] == '"v1"'
+
+    def test_not_modified_after_cache_clear_refetches(self):
+        """Test that a 304 whose entry was dropped in flight triggers a full GET."""
+        client = SerpShot(api_key="test-key-12345", cache_ttl=0)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if "If-None-Match" in request.headers:
+                client.cache_clear()
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                headers={"ETag": '"v1"'},
+                json={"code": 200, "msg": "ok", "data": 7},
+            )
+
+        client._http._client = httpx.Client(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+
+        assert client.get_available_credits() == 7
+        assert client.get_available_credits() == 7
+        assert len(calls) == 3
+        assert "If-None-Match" not in calls[2].headers
+
+    @pytest.mark.asyncio
+    async def test_async_not_modified_after_cache_clear_refetches(self):
+        """Test the async client refetches when a 304 finds no cached entry."""
+        client = AsyncSerpShot(api_key="test-key-12345", cache_ttl=0)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if "If-None-Match" in request.headers:
+                client.cache_clear()
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                headers={"ETag": '"v1"'},
+                json={"code": 200, "msg": "ok", "data": 7},
+            )
+
+        client._http._client = httpx.AsyncClient(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+
+        async with client:
+            assert await client.get_available_credits() == 7
+            assert await client.get_available_credits() == 7
+        assert len(calls) == 3
+        assert "If-None-Match" not in calls[2].headers
+
+    def test_unsolicited_not_modified_raises(self):
+        """Test that a 304 is never parsed or cached as a payload."""
+        client, calls = self._client([httpx.Response(304)], cache_ttl=60)
+
+        with pytest.raises(APIError) as exc_info:
+            client.get_available_credits()
+
+        assert exc_info.value.status_code == 304
+        assert client.cache_info().currsize == 0
+
+    def test_cache_disabled_by_default(self):
+        """Test that GETs hit the network every time without cache_ttl."""
+        ok = httpx.Response(200, json={"code": 200, "msg": "ok", "data": 7})
+        client, calls = self._client([ok, ok])
+
+        client.get_available_credits()
+        client.get_available_credits()
+
+        assert len(calls) == 2
+        assert client.cache_info() == (0, 0, 0, 0)
+
+    def test_no_store_responses_are_not_cached(self):
+        """Test that Cache-Control: no-store is respected."""
+        ok = httpx.Response(
+            200,
+            headers={"Cache-Control": "no-store"},
+            json={"code": 200, "msg": "ok", "data": 7},
+        )
+        client, calls = self._client([ok, ok], cache_ttl=60)
+
+        client.get_available_credits()
+        client.get_available_credits()
+
+        assert len(calls) == 2
+
+
+class TestRequestCoalescing:
+    """Test single-flight coalescing of identical in-flight GET requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_one_request(self):
+        """Test that concurrent identical GETs trigger one network call."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"code": 200, "msg": "ok", "data": 5})
+
+        client = AsyncSerpShot(api_key="test-key-12345")
+        client._http._client = httpx.AsyncClient(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+
+        results = await asyncio.gather(*(client.get_available_credits() for _ in range(5)))
+
+        assert results == [5] * 5
+        assert len(calls) == 1
+        assert client._http._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_waiters_receive_leader_error(self):
+        """Test that an error from the shared request reaches every caller."""
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(400, json={"error": "bad"})
+
+        client = AsyncSerpShot(api_key="test-key-12345")
+        client._http._client = httpx.AsyncClient(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+
+        results = await asyncio.gather(
+            *(client.get_available_credits() for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, APIError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelling_first_caller_does_not_cancel_others(self):
+        """Test that waiters still get the result when the first caller is cancelled."""
+        async def handler(request):
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={"code": 200, "msg": "ok", "data": {"n": 1}})
+
+        http = AsyncHTTPClient(base_url="https://api.test", headers={}, timeout=1.0)
+        http._client = httpx.AsyncClient(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+
+        first = asyncio.ensure_future(http.request("GET", "/data"))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(http.request("GET", "/data"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        result = await second
+        assert result == {"n": 1}
+        assert first.cancelled()
+
+        # Each caller gets its own copy of the shared result
+        result["n"] = 2
+        assert await http.request("GET", "/data") == {"n": 1}
+
+    def test_sync_concurrent_identical_gets_share_one_request(self):
+        """Test that threads issuing the same GET share one network call."""
+        calls = []
+        release = threading.Event()
+
+        def handler(request):
+            calls.append(request)
+            release.wait(1)
+            return httpx.Response(200, json={"code": 200, "msg": "ok", "data": 5})
+
+        client = SerpShot(api_key="test-key-12345")
+        client._http._client = httpx.Client(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(client.get_available_credits) for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == [5] * 4
+        assert len(calls) == 1
+
+
+class TestWarmUp:
+    """Test connection warm-up."""
+
+    @pytest.mark.asyncio
+    async def test_warm_up_sends_head_request(self):
+        """Test that warm_up issues a HEAD request on the pooled client."""
+        transport, calls = _mock_transport([httpx.Response(200)])
+        client = AsyncSerpShot(api_key="test-key-12345")
+        client._http._client = httpx.AsyncClient(
+            base_url="https://api.test", transport=transport
+        )
+
+        await client.warm_up()
+
+        assert [request.method for request in calls] == ["HEAD"]
+
+    def test_warm_up_ignores_connection_errors(self):
+        """Test that warm-up failures do not raise."""
+        def handler(request):
+            raise httpx.ConnectError("unreachable", request=request)
+
+        client = SerpShot(api_key="test-key-12345")
+        client._http._client = httpx.Client(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+
+        client.warm_up()
+
+
+class TestThrottledMap:
+    """Test rate-limited async mapping helper."""
+
+    @pytest.mark.asyncio
+    async def test_preserves_order_and_caps_concurrency(self):
+        """Test results keep input order and concurrency stays bounded."""
+        in_flight = 0
+        peak = 0
+
+        async def work(item, *, offset):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return item + offset
+
+        results = await throttled_map(
+            work, range(10), max_per_second=1000, max_at_once=3, offset=100
+        )
+
+        assert results == list(range(100, 110))
+        assert peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_limits_raise_error(self):
+        """Test that non-positive limits are rejected."""
+        async def work(item):
+            return item
+
+        with pytest.raises(ValueError):
+            await throttled_map(work, [1], max_per_second=0, max_at_once=1)
+        with pytest.raises(ValueError):
+            await throttled_map(work, [1], max_per_second=1, max_at_once=0)
+
+    @pytest.mark.asyncio
+    async def test_error_cancels_remaining_calls(self):
+        """Test that one failing call cancels the others instead of leaking them."""
+        started = []
+
+        async def work(item):
+            started.append(item)
+            if item == 0:
+                raise RuntimeError("boom")
+            await asyncio.sleep(10)
+
+        before = asyncio.all_tasks()
+        with pytest.raises(RuntimeError, match="boom"):
+            await throttled_map(work, range(10), max_per_second=100, max_at_once=2)
+
+        assert asyncio.all_tasks() == before
+        assert len(started) < 10
 
 
 class TestSearchResponse:
@@ -298,66 +1025,107 @@ class TestSearchResponse:
         assert len(response.results) == 1
         assert response.results[0].title == "Test Result"
 
+    def test_image_result_dicts_validate_as_image_results(self):
+        """Test that image result dicts validate as ImageResult."""
+        image = {
+            "title": "Cat",
+            "link": "https://img.example.com/cat.jpg",
+            "thumbnail": "https://img.example.com/cat_t.jpg",
+            "source": "example.com",
+            "source_link": "https://example.com/cat",
+            "width": 640,
+            "height": 480,
+            "position": 1,
+        }
 
-# Integration test markers
-@pytest.mark.integration
-class TestIntegration:
-    """Integration tests (require real API key)."""
+        response = SearchResponse(
+            success=True,
+            query="cats",
+            total_results="1",
+            search_time="0.1",
+            results=[image],
+            credits_used=2,
+        )
 
-    @pytest.mark.skip(reason="Requires API key and credits")
-    def test_real_search(self):
-        """Test real API search (requires API key)."""
-        api_key = os.getenv("SERPSHOT_API_KEY")
-        
-        if not api_key:
-            pytest.skip("SERPSHOT_API_KEY not set")
-        
-        # Test with explicit API key
-        with SerpShot(api_key=api_key) as client:
-            response = client.search("Python", num=5)
-            assert response.success
-            assert len(response.results) > 0
-
-    @pytest.mark.skip(reason="Requires API key and credits")
-    def test_real_search_from_env_var(self):
-        """Test real API search using environment variable."""
-        api_key = os.getenv("SERPSHOT_API_KEY")
-        
-        if not api_key:
-            pytest.skip("SERPSHOT_API_KEY not set")
-        
-        # Test with environment variable (should work if env var is set)
-        with SerpShot() as client:
-            response = client.search("Python", num=5)
-            assert response.success
-            assert len(response.results) > 0
+        assert isinstance(response.results[0], ImageResult)
+        assert SearchResponse.model_validate_json(response.model_dump_json()) == response
 
-    @pytest.mark.skip(reason="Requires API key and credits")
-    @pytest.mark.asyncio
-    async def test_real_async_search(self):
-        """Test real async API search (requires API key)."""
-        api_key = os.getenv("SERPSHOT_API_KEY")
-        
-        if not api_key:
-            pytest.skip("SERPSHOT_API_KEY not set")
-        
-        # Test with explicit API key
-        async with AsyncSerpShot(api_key=api_key) as client:
-            response = await client.search("Python", num=5)
-            assert response.success
-            assert len(response.results) > 0
 
-    @pytest.mark.skip(reason="Requires API key and credits")
-    @pytest.mark.asyncio
-    async def test_real_async_search_from_env_var(self):
-        """Test real async API search using environment variable."""
-        api_key = os.getenv("SERPSHOT_API_KEY")
-        
-        if not api_key:
-            pytest.skip("SERPSHOT_API_KEY not set")
-        
-        # Test with environment variable (should work if env var is set)
-        async with AsyncSerpShot() as client:
-            response = await client.search("Python", num=5)
-            assert response.success
-            assert len(response.results) > 0
+class TestParseSearchResponse:
+    """Test conversion of backend payloads into response models."""
+
+    def test_image_results_are_transformed(self):
+        """Test that image payloads become ImageResult items."""
+        data = {
+            "search_params": {"q": "cats", "type": "image"},
+            "search_info": {"total_results": "10", "search_time": "0.1"},
+            "results": [
+                {
+                    "title": "Cat",
+                    "imageUrl": "https://img.example.com/cat.jpg",
+                    "thumbnailUrl": "https://img.example.com/cat_t.jpg",
+                    "source": "example.com",
+                    "link": "https://example.com/cat",
+                    "imageWidth": 640,
+                    "imageHeight": 480,
+                    "position": 1,
+                }
+            ],
+            "credits": 2,
+        }
+
+        response = BaseClient._parse_search_response(data)
+
+        assert isinstance(response.results[0], ImageResult)
+        assert response.results[0].link == "https://img.example.com/cat.jpg"
+        assert response.results[0].source_link == "https://example.com/cat"
+        assert response.credits_used == 2
+
+    def test_incomplete_image_results_get_defaults(self):
+        """Test that missing backend image fields fall back to defaults."""
+        data = {
+            "search_params": {"q": "cats", "type": "image"},
+            "results": [{"title": "Cat", "imageUrl": "https://img.example.com/cat.jpg"}],
+        }
+
+        result = BaseClient._parse_search_response(data).results[0]
+
+        assert result.link == "https://img.example.com/cat.jpg"
+        assert (result.thumbnail, result.width, result.position) == ("", 0, 0)
+
+    def test_web_results_are_validated(self):
+        """Test that regular search payloads become SearchResult items."""
+        data = {
+            "search_params": {"q": "python", "type": "search"},
+            "results": [
+                {"title": "Python", "link": "https://python.org", "snippet": "", "position": 1}
+            ],
+        }
+
+        response = BaseClient._parse_search_response(data)
+
+        assert isinstance(response.results[0], SearchResult)
+        assert response.query == "python"
+
+    def test_batch_pads_missing_results(self):
+        """Test that queries without a backend result get empty responses."""
+        data = [{"search_params": {"q": "a"}, "results": []}]
+
+        responses = BaseClient._process_search_response(data, ["a", "b", "c"])
+
+        assert [r.query for r in responses] == ["a", "b", "c"]
+        assert BaseClient._process_search_response([], "solo").query == "solo"
+
+    @pytest.mark.parametrize("data", [None, [], {"search_params": None, "results": None}])
+    def test_empty_payloads(self, data):
+        """Test that empty or null payloads produce an empty response."""
+        response = BaseClient._parse_search_response(data, query="fallback")
+
+        assert response.success
+        assert response.query == "fallback"
+        assert response.results == []
+
+        # Empty responses are copies of one template and must not share results
+        response.results.append("x")
+        assert BaseClient._parse_search_response(None).results == []
+